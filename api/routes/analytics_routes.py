@@ -8,13 +8,25 @@ from typing import Dict, Any, List
 import logging
 from datetime import datetime
 
-from src.analytics.data_science_engine import analytics_engine
-from src.analytics.visualization_engine import viz_engine
-from database.mongodb_config import db_manager
-
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Engines and the MongoDB driver are imported on first request so app startup stays fast
+def get_analytics_engine():
+    from src.analytics.data_science_engine import get_analytics_engine as accessor
+    return accessor()
+
+def get_viz_engine():
+    from src.analytics.visualization_engine import get_viz_engine as accessor
+    return accessor()
+
+async def get_db_manager():
+    """Database manager with an open connection"""
+    from database.mongodb_config import db_manager
+    if not db_manager.db:
+        await db_manager.connect()
+    return db_manager
+
 @router.get("/analytics/dashboard", response_class=HTMLResponse)
 async def get_analytics_dashboard():
     """
@@ -22,8 +34,9 @@ async def get_analytics_dashboard():
     """
     try:
         # Ensure database connection
-        if not db_manager.db:
-            await db_manager.connect()
+        await get_db_manager()
+        analytics_engine = get_analytics_engine()
+        viz_engine = get_viz_engine()
         
         # Generate analytics data
         analytics_data = await analytics_engine.generate_analytics_dashboard_data()
@@ -74,8 +87,8 @@ async def get_analytics_data():
     """
     try:
         # Ensure database connection
-        if not db_manager.db:
-            await db_manager.connect()
+        await get_db_manager()
+        analytics_engine = get_analytics_engine()
         
         analytics_data = await analytics_engine.generate_analytics_dashboard_data()
         return analytics_data
@@ -91,13 +104,13 @@ async def get_ml_insights():
     """
     try:
         # Ensure database connection
-        if not db_manager.db:
-            await db_manager.connect()
+        await get_db_manager()
+        analytics_engine = get_analytics_engine()
         
-        # Collect workflow data
-        df = await analytics_engine.collect_workflow_data(days_back=30)
+        # Fitted once per data version on the whole window, shared with the dashboard
+        ml_results = await analytics_engine.ml_insights(days_back=30)
         
-        if df.empty:
+        if not ml_results['data_summary']['total_samples']:
             return {
                 "message": "No data available for ML analysis",
                 "predictions": {},
@@ -105,9 +118,8 @@ async def get_ml_insights():
                 "recommendations": []
             }
         
-        # Generate ML predictions
-        prediction_results = await analytics_engine.predict_workflow_success(df)
-        clustering_results = await analytics_engine.cluster_workflow_patterns(df)
+        prediction_results = ml_results['predictions']
+        clustering_results = ml_results['clustering']
         
         # Generate recommendations based on ML results
         recommendations = _generate_ml_recommendations(prediction_results, clustering_results)
@@ -116,11 +128,7 @@ async def get_ml_insights():
             "predictions": prediction_results,
             "clustering": clustering_results,
             "recommendations": recommendations,
-            "data_summary": {
-                "total_samples": len(df),
-                "date_range": f"{df['created_at'].min()} to {df['created_at'].max()}" if 'created_at' in df.columns else "N/A",
-                "avg_success_score": df['success_score'].mean() if 'success_score' in df.columns else 0
-            }
+            "data_summary": ml_results['data_summary']
         }
         
     except Exception as e:
@@ -134,38 +142,43 @@ async def get_performance_metrics():
     """
     try:
         # Ensure database connection
-        if not db_manager.db:
-            await db_manager.connect()
+        await get_db_manager()
+        analytics_engine = get_analytics_engine()
         
-        df = await analytics_engine.collect_workflow_data(days_back=30)
+        # Aggregated inside MongoDB; no workflow documents are loaded here
+        summary = await analytics_engine.workflow_summary(days_back=30)
+        total = summary['total']
         
-        if df.empty:
+        if not total:
             return {
                 "error": "No workflow data available",
                 "metrics": {}
             }
         
         # Calculate detailed metrics
+        avg_tokens = summary['avg_tokens'] or 0
         metrics = {
             "workflow_volume": {
-                "total": len(df),
-                "daily_average": len(df) / 30,
-                "peak_day": df.groupby(df['created_at'].dt.date).size().max() if 'created_at' in df.columns else 0
+                "total": total,
+                "daily_average": total / 30,
+                "peak_day": max((row['count'] for row in summary['daily_counts']), default=0)
             },
             "success_metrics": {
-                "average_score": df['success_score'].mean() if 'success_score' in df.columns else 0,
-                "success_rate": (df['success_score'] > 75).mean() * 100 if 'success_score' in df.columns else 0,
-                "completion_rate": (df['status'] == 'completed').mean() * 100 if 'status' in df.columns else 0
+                "average_score": summary['avg_success_score'] or 0,
+                "success_rate": summary['successful'] / total * 100,
+                "completion_rate": summary['completed'] / total * 100
             },
             "efficiency_metrics": {
-                "avg_execution_time": df['execution_time'].mean() if 'execution_time' in df.columns else 0,
-                "avg_tokens_used": df['total_tokens'].mean() if 'total_tokens' in df.columns else 0,
-                "cost_per_workflow": (df['total_tokens'].mean() * 0.00015) if 'total_tokens' in df.columns else 0  # Approximate cost
+                "avg_execution_time": summary['avg_execution_time'] or 0,
+                "avg_tokens_used": avg_tokens,
+                "cost_per_workflow": avg_tokens * 0.00015  # Approximate cost
+            },
+            "priority_analysis": {
+                row['_id']: row['count'] for row in sorted(summary['priority'], key=lambda row: -row['count'])
             },
-            "priority_analysis": df['priority'].value_counts().to_dict() if 'priority' in df.columns else {},
             "time_patterns": {
-                "peak_hour": df['hour'].mode().iloc[0] if 'hour' in df.columns and not df['hour'].mode().empty else 0,
-                "busiest_day": df['day_of_week'].mode().iloc[0] if 'day_of_week' in df.columns and not df['day_of_week'].mode().empty else 0
+                "peak_hour": summary['peak_hour'],
+                "busiest_day": summary['busiest_day']
             }
         }
         
@@ -186,8 +199,7 @@ async def store_workflow_data(workflow_data: Dict[str, Any]):
     """
     try:
         # Ensure database connection
-        if not db_manager.db:
-            await db_manager.connect()
+        db_manager = await get_db_manager()
         
         # Add analytics metadata
         analytics_record = {
@@ -199,6 +211,15 @@ async def store_workflow_data(workflow_data: Dict[str, Any]):
         # Store in MongoDB
         result = await db_manager.db.workflows.insert_one(analytics_record)
         
+        # Fold into the hourly/daily rollups the dashboards read, then invalidate cached analytics
+        from src.analytics.analytics_cache import bump_data_version
+        from src.analytics.workflow_rollups import record_workflow
+        try:
+            await record_workflow(db_manager.db, analytics_record)
+            await bump_data_version(db_manager.db)
+        except Exception as e:
+            logger.error(f"Error updating workflow rollups (re-run the rollup backfill): {e}")
+        
         return {
             "message": "Workflow data stored successfully",
             "document_id": str(result.inserted_id),
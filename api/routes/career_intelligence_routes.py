@@ -3,18 +3,34 @@
 Advanced API endpoints for Level 1 & Level 2 Career Analytics Integration
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from pydantic import BaseModel
-from typing import Dict, Any, List, Optional
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Request
+from fastapi.responses import Response
+from pydantic import BaseModel, Field
+from dataclasses import asdict
+from typing import Dict, Any, List, Literal, Optional, Union
 import logging
 from datetime import datetime
 import asyncio
+import json
+import sys
 
-from src.analytics.career_intelligence_engine import career_engine, CareerMetrics
+from src.utils.http_cache import encoded_response, etag_for, is_not_modified, not_modified_response
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/career-intelligence", tags=["Career Intelligence"])
 
+_ENGINE_MODULE = "src.analytics.career_intelligence_engine"
+
+def get_career_engine():
+    """Career engine; pandas/sklearn are imported and models loaded on first request"""
+    from src.analytics.career_intelligence_engine import get_career_engine as accessor
+    return accessor()
+
+def _loaded_career_engine():
+    """The career engine if something already built it, without triggering construction"""
+    module = sys.modules.get(_ENGINE_MODULE)
+    return module.get_career_engine.peek() if module is not None else None
+
 # Pydantic Models
 class CareerProfileRequest(BaseModel):
     city: str = "Toronto"
@@ -29,6 +45,43 @@ class CareerProfileRequest(BaseModel):
     github_commits: int = 50
     years_experience: float = 2.0
 
+# Upper bound on profiles per batch request to keep a single call's memory predictable
+MAX_BATCH_PROFILES = 20000
+
+class CareerBatchRequest(BaseModel):
+    profiles: List[CareerProfileRequest] = Field(..., min_length=1, max_length=MAX_BATCH_PROFILES)
+
+class CareerOutcome(CareerProfileRequest):
+    """An observed outcome: the profile plus its actual salary and/or hiring result"""
+    salary_cad: Optional[float] = Field(None, gt=0)
+    hired: Optional[bool] = None
+
+class CareerOutcomesRequest(BaseModel):
+    outcomes: List[CareerOutcome] = Field(..., min_length=1, max_length=MAX_BATCH_PROFILES)
+
+class FeatureSweep(BaseModel):
+    """Values to try for one feature: ``steps`` points from ``start`` to ``stop``, or explicit ``values``"""
+    start: Optional[float] = None
+    stop: Optional[float] = None
+    steps: int = Field(11, ge=2, le=1000)
+    values: Optional[List[Union[float, str]]] = Field(None, min_length=1, max_length=1000)
+
+class WhatIfRequest(BaseModel):
+    profile: CareerProfileRequest = CareerProfileRequest()
+    sweeps: Dict[str, FeatureSweep] = Field(..., min_length=1, max_length=4)
+
+class UpskillingPlanRequest(BaseModel):
+    profile: CareerProfileRequest = CareerProfileRequest()
+    budget_months: int = Field(12, ge=1, le=240)
+    objective: Literal['salary', 'job_match'] = 'salary'
+    beam_width: int = Field(16, ge=1, le=256)
+
+class CareerBatchResponse(BaseModel):
+    results: List[Dict[str, float]]
+    count: int
+    processing_time_ms: float
+    timestamp: str
+
 class CareerAnalysisResponse(BaseModel):
     predictions: Dict[str, Any]
     scores: Dict[str, float]
@@ -37,12 +90,43 @@ class CareerAnalysisResponse(BaseModel):
     market_analysis: Dict[str, Any]
     timestamp: str
     
+class CareerAnalysisWithDashboardResponse(CareerAnalysisResponse):
+    dashboard_html: str
+
+class DashboardRenderRequest(BaseModel):
+    """A profile plus the insights /analyze already returned for it"""
+    profile: CareerProfileRequest
+    insights: CareerAnalysisResponse
+
 class ModelTrainingResponse(BaseModel):
+    job_id: str
     training_status: str
-    model_scores: Dict[str, float]
-    training_time: str
+    stage: str
+    progress: float
+    model_scores: Optional[Dict[str, float]] = None
+    training_report: Optional[Dict[str, Dict[str, float]]] = None
+    training_time: Optional[str] = None
+    error: Optional[str] = None
     timestamp: str
 
+def _training_job_response(job) -> ModelTrainingResponse:
+    """Serialize a background training job"""
+    training_time = None
+    if job.started_at and job.finished_at:
+        training_time = str(datetime.fromisoformat(job.finished_at) - datetime.fromisoformat(job.started_at))
+    
+    return ModelTrainingResponse(
+        job_id=job.job_id,
+        training_status=job.status,
+        stage=job.stage,
+        progress=round(job.progress, 2),
+        model_scores=job.scores,
+        training_report=job.report,
+        training_time=training_time,
+        error=job.error,
+        timestamp=datetime.now().isoformat()
+    )
+
 @router.post("/analyze", response_model=CareerAnalysisResponse)
 async def analyze_career_profile(profile: CareerProfileRequest):
     """
@@ -61,6 +145,7 @@ async def analyze_career_profile(profile: CareerProfileRequest):
     - Interactive visualization data
     """
     try:
+        career_engine = get_career_engine()
         logger.info(f"🚀 Starting career analysis for profile: {profile.city}, {profile.industry}")
         
         # Convert Pydantic model to dict
@@ -76,8 +161,121 @@ async def analyze_career_profile(profile: CareerProfileRequest):
         logger.error(f"❌ Error in career analysis: {e}")
         raise HTTPException(status_code=500, detail=f"Career analysis failed: {str(e)}")
 
+async def _dashboard_response(request: Request, profile: CareerProfileRequest, build) -> Response:
+    """
+    Compute insights, answer 304 if the client's ETag still matches (skipping the render),
+    otherwise render the dashboard and return ``build(insights, html)`` compressed
+    """
+    career_engine = get_career_engine()
+    profile_dict = profile.dict()
+    insights = await career_engine.generate_career_insights(profile_dict)
+    etag = career_engine.dashboard_etag(profile_dict, insights)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    
+    dashboard_html = await career_engine.create_career_dashboard(profile_dict, insights=insights)
+    body, media_type = build(insights, dashboard_html)
+    return encoded_response(request, body, media_type, etag)
+
+@router.post("/analyze-with-dashboard", response_model=CareerAnalysisWithDashboardResponse)
+async def analyze_career_profile_with_dashboard(profile: CareerProfileRequest, request: Request):
+    """
+    🎯📊 SINGLE-PASS ANALYSIS + DASHBOARD
+    
+    Compute career insights once and return them together with the rendered dashboard,
+    instead of calling /analyze and /dashboard/{profile_id} for the same profile.
+    Responses carry an ETag (If-None-Match -> 304) and honour gzip/brotli Accept-Encoding.
+    """
+    try:
+        logger.info(f"🚀 Starting single-pass career analysis for profile: {profile.city}, {profile.industry}")
+        
+        def build(insights, dashboard_html):
+            response = CareerAnalysisWithDashboardResponse(**insights, dashboard_html=dashboard_html)
+            return response.model_dump_json().encode(), "application/json"
+        
+        return await _dashboard_response(request, profile, build)
+        
+    except Exception as e:
+        logger.error(f"❌ Error in career analysis: {e}")
+        raise HTTPException(status_code=500, detail=f"Career analysis failed: {str(e)}")
+
+@router.post("/dashboard-from-insights")
+async def render_career_dashboard(request: DashboardRenderRequest):
+    """
+    📊 Render the dashboard from insights returned by /analyze, without rerunning the models
+    """
+    try:
+        career_engine = get_career_engine()
+        dashboard_html = await career_engine.create_career_dashboard(
+            request.profile.dict(), insights=request.insights.dict()
+        )
+        return {
+            "dashboard_html": dashboard_html,
+            "timestamp": datetime.now().isoformat(),
+            "status": "success"
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ Error rendering dashboard: {e}")
+        raise HTTPException(status_code=500, detail=f"Dashboard generation failed: {str(e)}")
+
+@router.post("/analyze-batch", response_model=CareerBatchResponse)
+async def analyze_career_profiles_batch(request: CareerBatchRequest):
+    """
+    📦 BATCH CAREER SCORING
+    
+    Score a whole cohort of profiles in one vectorized pass:
+    one feature transform and one predict call per model for the entire batch.
+    Results are returned in the same order as the submitted profiles.
+    """
+    try:
+        career_engine = get_career_engine()
+        logger.info(f"📦 Starting batch career scoring for {len(request.profiles)} profiles")
+        start_time = datetime.now()
+        
+        profiles = [profile.dict() for profile in request.profiles]
+        metrics = await career_engine.predict_career_metrics_batch(profiles)
+        
+        return CareerBatchResponse(
+            results=[asdict(m) for m in metrics],
+            count=len(metrics),
+            processing_time_ms=round((datetime.now() - start_time).total_seconds() * 1000, 2),
+            timestamp=datetime.now().isoformat()
+        )
+        
+    except Exception as e:
+        logger.error(f"❌ Error in batch career scoring: {e}")
+        raise HTTPException(status_code=500, detail=f"Batch career scoring failed: {str(e)}")
+
+@router.post("/what-if")
+async def analyze_what_if(request: WhatIfRequest):
+    """
+    🔬 WHAT-IF SENSITIVITY CURVES
+    
+    Sweep one or more features (e.g. ml_skill from 3 to 7) around a profile and return the
+    predicted salary and job-match probability at every grid point. The whole grid is scored
+    in one batched inference call, so a 100-point sweep costs about as much as one prediction.
+    """
+    try:
+        career_engine = get_career_engine()
+        start_time = datetime.now()
+        sweeps = {feature: sweep.model_dump() for feature, sweep in request.sweeps.items()}
+        curves = await career_engine.predict_sensitivity(request.profile.model_dump(), sweeps)
+        processing_time = (datetime.now() - start_time).total_seconds() * 1000
+        return {
+            **curves,
+            "processing_time_ms": round(processing_time, 2),
+            "timestamp": datetime.now().isoformat()
+        }
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ Error in what-if analysis: {e}")
+        raise HTTPException(status_code=500, detail=f"What-if analysis failed: {str(e)}")
+
 @router.post("/dashboard/{profile_id}")
-async def generate_career_dashboard(profile_id: str, profile: CareerProfileRequest):
+async def generate_career_dashboard(profile_id: str, profile: CareerProfileRequest, request: Request):
     """
     📊 INTERACTIVE CAREER DASHBOARD
     
@@ -92,52 +290,105 @@ async def generate_career_dashboard(profile_id: str, profile: CareerProfileReque
     try:
         logger.info(f"📊 Generating career dashboard for profile: {profile_id}")
         
-        profile_dict = profile.dict()
+        def build(insights, dashboard_html):
+            return json.dumps({
+                "profile_id": profile_id,
+                "dashboard_html": dashboard_html,
+                "timestamp": datetime.now().isoformat(),
+                "status": "success"
+            }).encode(), "application/json"
         
-        # Generate interactive dashboard HTML
-        dashboard_html = await career_engine.create_career_dashboard(profile_dict)
+        # Generate interactive dashboard HTML (304 if the client already has this version)
+        return await _dashboard_response(request, profile, build)
         
-        return {
-            "profile_id": profile_id,
-            "dashboard_html": dashboard_html,
-            "timestamp": datetime.now().isoformat(),
-            "status": "success"
-        }
+    except Exception as e:
+        logger.error(f"❌ Error generating dashboard: {e}")
+        raise HTTPException(status_code=500, detail=f"Dashboard generation failed: {str(e)}")
+
+@router.get("/dashboard/{profile_id}/html")
+async def get_career_dashboard_html(profile_id: str, request: Request, profile: CareerProfileRequest = Depends()):
+    """
+    📊 Dashboard as a plain HTML document (profile fields as query parameters), cacheable by
+    the browser: repeat views of an unchanged profile are answered with 304 Not Modified
+    """
+    try:
+        logger.info(f"📊 Serving career dashboard HTML for profile: {profile_id}")
+        return await _dashboard_response(
+            request, profile, lambda insights, dashboard_html: (dashboard_html.encode(), "text/html; charset=utf-8")
+        )
         
     except Exception as e:
         logger.error(f"❌ Error generating dashboard: {e}")
         raise HTTPException(status_code=500, detail=f"Dashboard generation failed: {str(e)}")
 
-@router.post("/train-models", response_model=ModelTrainingResponse)
-async def train_career_models(background_tasks: BackgroundTasks):
+@router.post("/train-models", response_model=ModelTrainingResponse, status_code=202)
+async def train_career_models():
     """
     🤖 TRAIN MACHINE LEARNING MODELS
     
-    Train career prediction models:
+    Start a background job that trains career prediction models:
     - Salary prediction (Gradient Boosting)
     - Job match probability (Random Forest)
     - Career level classification (Random Forest)
+    
+    The new models replace the active ones atomically once fitting finishes.
+    Poll /train-models/{job_id} for progress.
     """
     try:
+        career_engine = get_career_engine()
         logger.info("🤖 Starting model training process...")
-        start_time = datetime.now()
-        
-        # Train models
-        scores = await career_engine.train_models()
-        
-        training_time = str(datetime.now() - start_time)
-        
-        return ModelTrainingResponse(
-            training_status="completed",
-            model_scores=scores,
-            training_time=training_time,
-            timestamp=datetime.now().isoformat()
-        )
+        job = career_engine.start_training_job()
+        return _training_job_response(job)
         
     except Exception as e:
         logger.error(f"❌ Error training models: {e}")
         raise HTTPException(status_code=500, detail=f"Model training failed: {str(e)}")
 
+@router.post("/outcomes", status_code=202)
+async def record_career_outcomes(request: CareerOutcomesRequest):
+    """
+    🔁 RECORD OBSERVED OUTCOMES
+    
+    Buffer labeled outcomes (actual salary, hired or not) for incremental model updates.
+    With CAREER_CONTINUOUS_LEARNING=1 an update is scheduled once enough outcomes are pending.
+    """
+    try:
+        career_engine = get_career_engine()
+        outcomes = [outcome.model_dump() for outcome in request.outcomes]
+        for outcome in outcomes:
+            if outcome['hired'] is not None:
+                outcome['hired'] = int(outcome['hired'])
+        result = await career_engine.record_outcomes(outcomes)
+        return {**result, "timestamp": datetime.now().isoformat()}
+        
+    except Exception as e:
+        logger.error(f"❌ Error recording outcomes: {e}")
+        raise HTTPException(status_code=500, detail=f"Outcome recording failed: {str(e)}")
+
+@router.post("/outcomes/apply")
+async def apply_career_outcomes(full_retrain: bool = False):
+    """
+    Absorb pending outcomes into the models now: an incremental warm-start update, or a full
+    retrain when requested or when drift/accumulated data crosses the update policy thresholds
+    """
+    try:
+        career_engine = get_career_engine()
+        update = await career_engine.apply_outcome_updates(full_retrain=full_retrain)
+        return {**update, "timestamp": datetime.now().isoformat()}
+        
+    except Exception as e:
+        logger.error(f"❌ Error applying outcomes: {e}")
+        raise HTTPException(status_code=500, detail=f"Model update failed: {str(e)}")
+
+@router.get("/train-models/{job_id}", response_model=ModelTrainingResponse)
+async def get_training_job_status(job_id: str):
+    """Report progress of a background model training job"""
+    career_engine = get_career_engine()
+    job = career_engine.get_training_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Training job not found")
+    return _training_job_response(job)
+
 @router.get("/metrics/{profile_id}")
 async def get_career_metrics(
     city: str = "Toronto",
@@ -157,6 +408,7 @@ async def get_career_metrics(
     Fast endpoint for real-time career scoring
     """
     try:
+        career_engine = get_career_engine()
         profile = {
             'city': city,
             'industry': industry,
@@ -187,30 +439,46 @@ async def get_career_metrics(
         logger.error(f"Error getting career metrics: {e}")
         raise HTTPException(status_code=500, detail=f"Metrics calculation failed: {str(e)}")
 
+@router.get("/market-analysis")
+async def get_market_snapshot(request: Request):
+    """
+    🗺️ ALL MARKETS
+    Market analysis for every city × industry pair in one response. The ETag follows the
+    dataset version, so dashboards can revalidate cheaply with If-None-Match.
+    """
+    try:
+        career_engine = get_career_engine()
+        etag = etag_for(['market_snapshot', career_engine.dataset_version])
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        
+        markets = [
+            {"city": city, "industry": industry, "market_data": analysis}
+            for (city, industry), analysis in career_engine.market_snapshot.items()
+        ]
+        body = json.dumps({
+            "dataset_version": career_engine.dataset_version,
+            "built_at": career_engine.market_snapshot_built_at,
+            "count": len(markets),
+            "markets": markets,
+            "timestamp": datetime.now().isoformat()
+        }).encode()
+        return encoded_response(request, body, "application/json", etag)
+        
+    except Exception as e:
+        logger.error(f"Error getting market snapshot: {e}")
+        raise HTTPException(status_code=500, detail=f"Market snapshot failed: {str(e)}")
+
 @router.get("/market-analysis/{city}/{industry}")
 async def get_market_analysis(city: str, industry: str):
     """
     📈 MARKET INTELLIGENCE
     Get comprehensive market analysis for specific city and industry
+    (served from the market snapshot precomputed for the current dataset version)
     """
     try:
-        # Sample profile for market analysis
-        sample_profile = {
-            'city': city,
-            'industry': industry,
-            'experience_level': 'Intermediate',
-            'education': 'Bachelor',
-            'python_skill': 6.0,
-            'sql_skill': 6.0,
-            'ml_skill': 4.0,
-            'communication_skill': 7.0,
-            'portfolio_projects': 3,
-            'github_commits': 100,
-            'years_experience': 3.0
-        }
-        
-        insights = await career_engine.generate_career_insights(sample_profile)
-        market_analysis = insights['market_analysis']
+        career_engine = get_career_engine()
+        market_analysis = career_engine.get_market_analysis(city, industry)
         
         return {
             "city": city,
@@ -236,6 +504,7 @@ async def get_skill_recommendations(
     Get AI-powered skill development recommendations
     """
     try:
+        career_engine = get_career_engine()
         profile = {
             'python_skill': current_python,
             'sql_skill': current_sql,
@@ -250,7 +519,8 @@ async def get_skill_recommendations(
             'years_experience': 3.0
         }
         
-        insights = await career_engine.generate_career_insights(profile)
+        # Only the recommendations and scores sections: no model predictions or market work
+        insights = await career_engine.generate_career_insights(profile, sections=['recommendations', 'scores'])
         
         return {
             "target_role": target_role,
@@ -264,12 +534,70 @@ async def get_skill_recommendations(
         logger.error(f"Error getting skill recommendations: {e}")
         raise HTTPException(status_code=500, detail=f"Skill analysis failed: {str(e)}")
 
+@router.post("/upskilling-plan")
+async def get_upskilling_plan(request: UpskillingPlanRequest):
+    """
+    🧭 MODEL-GUIDED UPSKILLING PLAN
+    
+    Search sequences of skill improvements that fit in the time budget and return the one
+    that maximizes predicted salary or job-match probability, with the predicted effect of
+    every step.
+    """
+    try:
+        career_engine = get_career_engine()
+        start_time = datetime.now()
+        plan = await career_engine.plan_upskilling(
+            request.profile.model_dump(),
+            budget_months=request.budget_months,
+            objective=request.objective,
+            beam_width=request.beam_width
+        )
+        processing_time = (datetime.now() - start_time).total_seconds() * 1000
+        return {
+            **plan,
+            "processing_time_ms": round(processing_time, 2),
+            "timestamp": datetime.now().isoformat()
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ Error planning upskilling: {e}")
+        raise HTTPException(status_code=500, detail=f"Upskilling plan failed: {str(e)}")
+
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """Hit/miss/eviction counters for the career metrics and insights cache"""
+    career_engine = get_career_engine()
+    return {
+        "insights_cache": career_engine.insights_cache.stats(),
+        "quantization_resolution": career_engine.cache_resolution,
+        "timestamp": datetime.now().isoformat()
+    }
+
 @router.get("/health")
 async def health_check():
-    """Health check for Career Intelligence API"""
+    """Health check for Career Intelligence API (never blocks on building the engine)"""
+    career_engine = _loaded_career_engine()
+    engine_status = {"engine_loaded": career_engine is not None, "engine_trained": False}
+    if career_engine is not None:
+        engine_status.update({
+            "engine_trained": career_engine.is_trained,
+            "market_source": career_engine.market_source.describe(),
+            "prediction_batching": career_engine.prediction_batcher.stats(),
+            "insights_cache": career_engine.insights_cache.stats(),
+            "compiled_inference": {
+                "enabled": career_engine.compiled_inference,
+                "max_rows": career_engine.compiled_max_rows,
+                "models": sorted(career_engine.bundle.compiled) if career_engine.bundle else []
+            },
+            "continuous_learning": {
+                "enabled": career_engine.continuous_learning,
+                "policy": asdict(career_engine.update_policy),
+                "last_update": career_engine.last_update
+            }
+        })
     return {
         "status": "healthy",
-        "engine_trained": career_engine.is_trained,
+        **engine_status,
         "timestamp": datetime.now().isoformat(),
         "version": "1.0.0",
         "features": [
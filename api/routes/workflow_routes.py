@@ -10,12 +10,6 @@ from datetime import datetime
 import asyncio
 import uuid
 
-from src.crews.workflow_crew import WorkflowCrew
-from src.agents.workflow_agent import WorkflowAgent
-from database.mongodb_config import db_manager
-from src.analytics.data_science_engine import analytics_engine
-from src.analytics.visualization_engine import viz_engine
-
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -36,10 +30,13 @@ class WorkflowResponse(BaseModel):
     result: Optional[Dict[str, Any]] = None
     created_at: str
 
-# Global crew instance and workflow storage
-workflow_crew = WorkflowCrew()
+# Workflow storage; the CrewAI crew is imported and built on first use
 workflows_db = {}  # Simple in-memory storage for workflows
 
+def get_workflow_crew():
+    from src.crews.workflow_crew import get_workflow_crew as accessor
+    return accessor()
+
 @router.post("/create", response_model=WorkflowResponse)
 async def create_workflow(request: WorkflowRequest):
     """Create a new workflow using CrewAI with Career Intelligence Integration"""
@@ -54,7 +51,8 @@ async def create_workflow(request: WorkflowRequest):
         career_keywords = ['career', 'job', 'skill', 'resume', 'interview', 'salary', 'promotion', 'data science', 'toronto']
         if any(keyword in request.description.lower() for keyword in career_keywords):
             try:
-                from src.analytics.career_intelligence_engine import career_engine
+                from src.analytics.career_intelligence_engine import get_career_engine
+                career_engine = get_career_engine()
                 
                 # 🎯 GENERATE REAL CAREER INTELLIGENCE DATA
                 # Extract key info from user's request
@@ -126,7 +124,7 @@ async def create_workflow(request: WorkflowRequest):
         }
         
         # Execute workflow management using CrewAI with enhanced context
-        result = workflow_crew.execute_workflow_management(workflow_data)
+        result = get_workflow_crew().execute_workflow_management(workflow_data)
         
         # Store workflow in database with full context
         workflows_db[workflow_id] = {
@@ -175,7 +173,7 @@ async def get_workflow_status(workflow_id: str):
     """Get workflow status and progress"""
     try:
         # Get crew status
-        crew_status = workflow_crew.get_crew_status()
+        crew_status = get_workflow_crew().get_crew_status()
         
         return {
             "workflow_id": workflow_id,
@@ -298,7 +296,8 @@ async def execute_workflow_background(workflow_id: str, workflow_data: Dict[str,
         # 🎯 REAL CAREER INTELLIGENCE PROCESSING
         if workflow_data.get("career_enhanced", False):
             try:
-                from src.analytics.career_intelligence_engine import career_engine
+                from src.analytics.career_intelligence_engine import get_career_engine
+                career_engine = get_career_engine()
                 
                 # Generate comprehensive career analysis
                 sample_profile = {
@@ -390,7 +389,7 @@ async def execute_standard_workflow(workflow_id: str, workflow_data: Dict[str, A
     """Standard workflow execution fallback"""
     try:
         # Execute using CrewAI
-        result = workflow_crew.execute_workflow_management({
+        result = get_workflow_crew().execute_workflow_management({
             "description": workflow_data.get("original_description", "Standard workflow execution"),
             "requirements": ["enhanced_execution"],
             "priority": workflow_data.get("priority", "medium")
@@ -417,7 +416,7 @@ async def execute_standard_workflow(workflow_id: str, workflow_data: Dict[str, A
 async def get_crews_status():
     """Get status of all CrewAI crews"""
     try:
-        crew_status = workflow_crew.get_crew_status()
+        crew_status = get_workflow_crew().get_crew_status()
         
         return {
             "crews": [crew_status],
@@ -34,7 +34,9 @@ app.add_middleware(
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="frontend/static"), name="static")
-templates = Jinja2Templates(directory="frontend/templates")
+# Shared, precompiled template environment (also renders the career dashboard)
+from src.utils.templating import template_env
+templates = Jinja2Templates(env=template_env)
 
 # Include API routes
 from api.routes.workflow_routes import router as workflow_router
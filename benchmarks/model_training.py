@@ -0,0 +1,53 @@
+"""
+Training speed: model flavors and worker counts
+Wall time, CPU time and held-out scores of the Career Intelligence models per configuration.
+
+    python benchmarks/model_training.py [rows]
+"""
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.analytics.model_training import create_models, fit_models
+
+
+def benchmark_training(X: np.ndarray, targets: Dict[str, np.ndarray], train_rows: np.ndarray,
+                       test_rows: np.ndarray, configurations: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Training report of every configuration: {name: {'flavor', 'forest_jobs', 'workers'}}"""
+    results = {}
+    for name, config in configurations.items():
+        models = create_models(config.get('flavor', 'standard'), config.get('forest_jobs', 1))
+        _, results[name] = fit_models(models, X, targets, train_rows, test_rows, workers=config.get('workers', 1))
+    return results
+
+
+if __name__ == "__main__":
+    from sklearn.model_selection import train_test_split
+    from src.analytics.career_intelligence_engine import CareerIntelligenceEngine
+    from src.analytics.feature_pipeline import CareerFeaturePipeline
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    df = CareerIntelligenceEngine._initialize_market_data(n_samples=rows)
+    pipeline = CareerFeaturePipeline().fit(df)
+    X_encoded = pipeline.encode(df)
+    X = (X_encoded - pipeline.mean_) / pipeline.scale_
+    targets = {
+        'salary_predictor': df['salary_cad'].to_numpy(),
+        'job_matcher': df['hired'].to_numpy(),
+        'career_classifier': X_encoded[:, pipeline.feature_names.index('experience_level')].astype(int)
+    }
+    train_rows, test_rows = train_test_split(np.arange(len(df)), test_size=0.2, random_state=42)
+    cpus = os.cpu_count() or 1
+    configurations = {
+        'standard_sequential': {'flavor': 'standard', 'workers': 1},
+        'standard_parallel': {'flavor': 'standard', 'workers': 3},
+        'hist_parallel': {'flavor': 'hist', 'workers': 3},
+        'hist_forest_jobs': {'flavor': 'hist', 'forest_jobs': cpus, 'workers': 1}
+    }
+    print(json.dumps(benchmark_training(X, targets, train_rows, test_rows, configurations), indent=2))
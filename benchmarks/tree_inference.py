@@ -0,0 +1,59 @@
+"""
+Inference latency: sklearn vs compiled tree ensembles
+p50/p99 latency of the Career Intelligence models for single rows and batches.
+
+    python benchmarks/tree_inference.py
+"""
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.analytics.tree_compiler import CompiledTreeEnsemble, compile_models
+
+
+def _latency_percentiles(fn, X: np.ndarray, repeats: int) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(X)
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        'p50_ms': round(float(np.percentile(timings, 50)), 4),
+        'p99_ms': round(float(np.percentile(timings, 99)), 4)
+    }
+
+
+def benchmark_inference(models: Dict[str, Any], compiled: Dict[str, CompiledTreeEnsemble], X: np.ndarray,
+                        batch_sizes: List[int] = (1, 1000), repeats: int = 200) -> Dict[str, Any]:
+    """p50/p99 latency of sklearn vs compiled inference for single rows and batches"""
+    report = {}
+    for name, ensemble in compiled.items():
+        model = models[name]
+        sklearn_fn = model.predict_proba if ensemble.kind == 'forest_classifier' else model.predict
+        compiled_fn = ensemble.predict_proba if ensemble.kind == 'forest_classifier' else ensemble.predict
+        report[name] = {}
+        for batch_size in batch_sizes:
+            batch = X[:batch_size]
+            runs = repeats if batch_size == 1 else max(5, repeats // 20)
+            report[name][f'batch_{batch_size}'] = {
+                'sklearn': _latency_percentiles(sklearn_fn, batch, runs),
+                'compiled': _latency_percentiles(compiled_fn, batch, runs)
+            }
+    return report
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("CAREER_COMPILED_INFERENCE", "1")
+    from src.analytics.career_intelligence_engine import CareerIntelligenceEngine
+
+    engine = CareerIntelligenceEngine()
+    X = engine.bundle.pipeline.transform(engine.canadian_job_market)
+    compiled = engine.bundle.compiled or compile_models(engine.bundle.models, X[:256])
+    print(json.dumps(benchmark_inference(engine.bundle.models, compiled, X), indent=2))
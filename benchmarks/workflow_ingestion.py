@@ -0,0 +1,95 @@
+"""
+Workflow ingestion: full documents vs projected streaming
+Wall time and peak traced memory of reading workflow-shaped documents with large
+result/description blobs, through ``to_list`` + ``pd.DataFrame`` and through read_workflow_frame.
+Needs a MongoDB reachable through database.mongodb_config.
+
+    python benchmarks/workflow_ingestion.py [sizes...]
+"""
+import logging
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.analytics.workflow_reader import DEFAULT_BATCH_SIZE, WORKFLOW_PROJECTION, read_workflow_frame
+
+logger = logging.getLogger(__name__)
+
+
+async def benchmark_ingestion(collection, sizes=(10_000, 100_000, 1_000_000), blob_bytes: int = 2048,
+                              batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[int, Dict[str, Dict[str, float]]]:
+    """
+    Seed ``collection`` (a scratch collection; it is emptied) with workflow-shaped documents
+    carrying ``blob_bytes`` of result/description text, then compare the full-document
+    ``to_list`` + ``pd.DataFrame`` path with read_workflow_frame: wall time and peak traced memory.
+    """
+    rng = np.random.default_rng(42)
+    now = datetime.now()
+    results: Dict[int, Dict[str, Dict[str, float]]] = {}
+
+    for size in sizes:
+        await collection.delete_many({})
+        for start in range(0, size, 10_000):
+            count = min(10_000, size - start)
+            await collection.insert_many([{
+                'created_at': now - timedelta(minutes=int(rng.integers(0, 60 * 24 * 29))),
+                'status': str(rng.choice(['completed', 'in_progress', 'failed', 'cancelled'])),
+                'priority': str(rng.choice(['low', 'medium', 'high', 'urgent'])),
+                'industry': str(rng.choice(['technology', 'finance', 'healthcare'])),
+                'execution_time': float(rng.exponential(30)),
+                'token_usage': {'total_tokens': int(rng.integers(100, 5000)), 'completion_tokens': int(rng.integers(50, 2000))},
+                'user_feedback': {'rating': int(rng.integers(1, 6))},
+                'description': 'd' * (blob_bytes // 2),
+                'result': {'content': 'r' * (blob_bytes // 2)}
+            } for _ in range(count)])
+        query = {'created_at': {'$gte': now - timedelta(days=30), '$lte': now}}
+
+        async def full_documents():
+            return pd.DataFrame(await collection.find(query).to_list(length=None))
+
+        async def projected_stream():
+            expected = await collection.count_documents(query)
+            return await read_workflow_frame(collection.find(query, WORKFLOW_PROJECTION, batch_size=batch_size),
+                                             expected=expected, batch_size=batch_size)
+
+        results[size] = {}
+        for name, read in (('to_list', full_documents), ('streaming', projected_stream)):
+            tracemalloc.start()
+            started = time.perf_counter()
+            frame = await read()
+            elapsed = time.perf_counter() - started
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results[size][name] = {'seconds': round(elapsed, 3), 'peak_mb': round(peak / 2**20, 1), 'rows': len(frame)}
+            del frame
+            logger.info(f"📊 {size:,} docs, {name}: {results[size][name]}")
+
+    await collection.drop()
+    return results
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    from database.mongodb_config import db_manager
+
+    async def main(sizes: Tuple[int, ...]):
+        await db_manager.connect()
+        try:
+            results = await benchmark_ingestion(db_manager.db.workflows_ingest_benchmark, sizes)
+        finally:
+            await db_manager.disconnect()
+        for size, runs in results.items():
+            for name, run in runs.items():
+                print(f"{size:>9,} docs  {name:<10} {run['seconds']:>8.3f}s  peak {run['peak_mb']:>8.1f} MB")
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(tuple(int(n) for n in sys.argv[1:]) or (10_000, 100_000, 1_000_000)))
@@ -53,6 +53,13 @@ class MongoDBManager:
             await self.db.user_behavior.create_index("user_session")
             await self.db.user_behavior.create_index("timestamp")
             
+            # Career outcomes collection indexes (pending outcomes are fetched oldest first)
+            await self.db.career_outcomes.create_index([("applied_to", 1), ("received_at", 1)])
+            
+            # Workflow rollup collections are read by period start
+            await self.db.workflow_rollups_hourly.create_index("start")
+            await self.db.workflow_rollups_daily.create_index("start")
+            
             logger.info("Database indexes created successfully")
         except Exception as e:
             logger.error(f"Error creating indexes: {e}")
@@ -105,6 +112,37 @@ COLLECTIONS = {
         "created_at": datetime,
         "last_updated": datetime,
         "model_parameters": dict
+    },
+    "career_outcomes": {
+        "city": str,
+        "industry": str,
+        "experience_level": str,
+        "education": str,
+        "salary_cad": float,  # actual salary, if known
+        "hired": int,  # 1/0 hiring result, if known
+        "received_at": datetime,
+        "applied_to": str,  # model bundle that absorbed the outcome, None while pending
+        "applied_at": datetime
+    },
+    "workflow_rollups_hourly": {
+        "_id": str,  # period, e.g. "2024-05-01T13"
+        "start": datetime,
+        "count": int,
+        "status": dict,  # status -> count
+        "priority": dict,  # priority -> count
+        "execution_time": dict,  # count, sum, sumsq
+        "tokens": dict  # sum, sumsq
+    },
+    "workflow_rollups_daily": {
+        "_id": str,  # period, e.g. "2024-05-01"
+        "start": datetime,
+        "count": int,
+        "status": dict,
+        "priority": dict,
+        "industry": dict,  # industry -> count
+        "execution_time": dict,
+        "tokens": dict,
+        "cells": dict  # all / priority.<p> / industry.<i> -> {"status|rating*10|time bucket": count}
     }
 }
 
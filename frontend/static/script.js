@@ -700,6 +700,43 @@ function showCareerLoading() {
     resultsDiv.classList.add('show');
 }
 
+// Last single-pass analysis (insights + dashboard HTML), reused while the profile is unchanged
+let lastCareerAnalysis = null;
+
+async function fetchCareerAnalysis(profile) {
+    const profileKey = JSON.stringify(profile);
+    if (lastCareerAnalysis && lastCareerAnalysis.profileKey === profileKey) {
+        return { ok: true, data: lastCareerAnalysis.data };
+    }
+    
+    const response = await fetch('/api/career-intelligence/analyze-with-dashboard', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(profile)
+    });
+    const data = await response.json();
+    if (response.ok) {
+        lastCareerAnalysis = { profileKey, data };
+    }
+    return { ok: response.ok, data };
+}
+
+function showCareerDashboard(dashboardHtml) {
+    const resultsDiv = document.getElementById('career-results');
+    resultsDiv.innerHTML = `
+        <div class="dashboard-results">
+            <div class="dashboard-header">
+                <h2>📊 Interactive Career Dashboard</h2>
+                <p>Real-time analytics and visualizations</p>
+            </div>
+            <div class="dashboard-content">
+                ${dashboardHtml}
+            </div>
+        </div>
+    `;
+    resultsDiv.classList.add('show');
+}
+
 async function analyzeCareer() {
     const button = event.target;
     const originalText = button.textContent;
@@ -713,17 +750,13 @@ async function analyzeCareer() {
         const profile = getCareerProfileData();
         console.log('Sending profile data:', profile);
         
-        const response = await fetch('/api/career-intelligence/analyze', {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify(profile)
-        });
-        
-        const data = await response.json();
+        // One request returns the analysis and the dashboard for this profile
+        const { ok, data } = await fetchCareerAnalysis(profile);
         console.log('Received response:', data);
         
-        if (response.ok) {
-            showCareerResults('Career Analysis Complete (ML-Powered)', data);
+        if (ok) {
+            const { dashboard_html, ...analysis } = data;
+            showCareerResults('Career Analysis Complete (ML-Powered)', analysis);
         } else {
             showCareerResults('Career Analysis Failed', data, false);
         }
@@ -793,30 +826,13 @@ async function generateDashboard() {
         const profile = getCareerProfileData();
         console.log('Generating dashboard for profile:', profile);
         
-        const response = await fetch(`/api/career-intelligence/dashboard/user-${Date.now()}`, {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify(profile)
-        });
-        
-        const data = await response.json();
+        // Reuses the dashboard from the last analysis when the profile has not changed
+        const { ok, data } = await fetchCareerAnalysis(profile);
         console.log('Dashboard response:', data);
         
-        if (response.ok) {
+        if (ok) {
             if (data.dashboard_html) {
-                const resultsDiv = document.getElementById('career-results');
-                resultsDiv.innerHTML = `
-                    <div class="dashboard-results">
-                        <div class="dashboard-header">
-                            <h2>📊 Interactive Career Dashboard</h2>
-                            <p>Real-time analytics and visualizations</p>
-                        </div>
-                        <div class="dashboard-content">
-                            ${data.dashboard_html}
-                        </div>
-                    </div>
-                `;
-                resultsDiv.classList.add('show');
+                showCareerDashboard(data.dashboard_html);
             } else {
                 // Show dashboard as structured data instead
                 showCareerResults('Dashboard Data Generated', data);
@@ -0,0 +1,71 @@
+"""
+Analytics Result Cache - Versioned, single-flight memoization of workflow analytics
+Results are keyed by computation, time window and the workflows data version (a counter in
+MongoDB bumped on every workflow write), so a write invalidates them in every process.
+Concurrent misses for the same key await one shared computation instead of each running it.
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from src.analytics.metrics_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Bookkeeping documents of the analytics (data version, rollup state) live in one collection
+STATE_COLLECTION = "analytics_state"
+DATA_VERSION_ID = "workflows_version"
+
+_MISSING = object()
+
+
+async def data_version(db) -> int:
+    """Current version of the workflows data (0 before the first versioned write)"""
+    state = await db[STATE_COLLECTION].find_one({"_id": DATA_VERSION_ID}, {"version": 1})
+    return int(state["version"]) if state else 0
+
+
+async def bump_data_version(db) -> None:
+    """Invalidate cached analytics everywhere after the workflows collection changed"""
+    await db[STATE_COLLECTION].update_one({"_id": DATA_VERSION_ID}, {"$inc": {"version": 1}}, upsert=True)
+
+
+class SingleFlightCache:
+    """TTL/LRU result cache where concurrent misses for one key share a single computation"""
+
+    def __init__(self, cache: TTLCache):
+        self.cache = cache
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._counters = {'computations': 0, 'coalesced': 0, 'failures': 0}
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        value = self.cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self._counters['coalesced'] += 1
+        else:
+            self._counters['computations'] += 1
+            task = asyncio.get_running_loop().create_task(self._compute(key, compute))
+            self._inflight[key] = task
+        # A cancelled caller (e.g. a dropped connection) must not cancel the shared computation
+        return await asyncio.shield(task)
+
+    async def _compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await compute()
+        except Exception:
+            # Failures reach every waiter but are not cached
+            self._counters['failures'] += 1
+            raise
+        else:
+            self.cache.set(key, value)
+            return value
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.cache.stats(), **self._counters, 'inflight': len(self._inflight)}
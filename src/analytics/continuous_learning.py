@@ -0,0 +1,193 @@
+"""
+Continuous Learning - Incremental Career Intelligence model updates from observed outcomes
+Labeled observations (actual salary, hired or not) are buffered in MongoDB. Each update
+warm-starts copies of the ensembles with a few extra trees fitted on the new rows only, so
+its cost tracks the new data; forests are compacted back under a tree cap, and a full
+retrain is reserved for when drift, accumulated data or booster growth crosses a threshold.
+"""
+import copy
+import logging
+import math
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.analytics.feature_pipeline import CATEGORICAL_FEATURES, NUMERICAL_FEATURES, PROFILE_DEFAULTS
+
+logger = logging.getLogger(__name__)
+
+OUTCOME_COLLECTION = "career_outcomes"
+LABEL_COLUMNS = ['salary_cad', 'hired']
+OUTCOME_FIELDS = CATEGORICAL_FEATURES + NUMERICAL_FEATURES + LABEL_COLUMNS
+
+
+@dataclass
+class UpdatePolicy:
+    """When and how much to update; every field can be overridden from the environment"""
+    min_rows: int = 20               # fewer labeled rows than this are left pending
+    max_rows_per_update: int = 50000
+    auto_apply_rows: int = 200       # pending rows that trigger an automatic update
+    drift_threshold: float = 0.25    # salary residual bias (in training std units) or hire-rate shift
+    retrain_fraction: float = 0.2    # incremental rows, as a share of training rows, before a retrain
+    max_tree_growth: float = 2.0     # ensembles may grow to this multiple of their base size
+    max_new_trees: int = 25
+
+    @classmethod
+    def from_env(cls) -> 'UpdatePolicy':
+        return cls(
+            min_rows=int(os.getenv("CAREER_UPDATE_MIN_ROWS", cls.min_rows)),
+            max_rows_per_update=int(os.getenv("CAREER_UPDATE_MAX_ROWS", cls.max_rows_per_update)),
+            auto_apply_rows=int(os.getenv("CAREER_UPDATE_AUTO_ROWS", cls.auto_apply_rows)),
+            drift_threshold=float(os.getenv("CAREER_DRIFT_THRESHOLD", cls.drift_threshold)),
+            retrain_fraction=float(os.getenv("CAREER_RETRAIN_FRACTION", cls.retrain_fraction)),
+            max_tree_growth=float(os.getenv("CAREER_MAX_TREE_GROWTH", cls.max_tree_growth)),
+            max_new_trees=int(os.getenv("CAREER_MAX_NEW_TREES", cls.max_new_trees))
+        )
+
+
+async def _default_db():
+    """Connected MongoDB database; the driver is imported on first use"""
+    from database.mongodb_config import db_manager
+
+    if db_manager.db is None and not await db_manager.connect():
+        raise RuntimeError("MongoDB is unavailable")
+    return db_manager.db
+
+
+class OutcomeBuffer:
+    """MongoDB collection of labeled outcomes; ``applied_to`` records the bundle that absorbed each one"""
+
+    def __init__(self, db_provider: Optional[Callable[[], Awaitable[Any]]] = None,
+                 collection: str = OUTCOME_COLLECTION):
+        self._db_provider = db_provider or _default_db
+        self.collection_name = collection
+
+    async def _collection(self):
+        return (await self._db_provider())[self.collection_name]
+
+    async def append(self, outcomes: List[Dict[str, Any]]) -> int:
+        received_at = datetime.now()
+        documents = [
+            {**{field: outcome.get(field) for field in OUTCOME_FIELDS}, 'received_at': received_at, 'applied_to': None}
+            for outcome in outcomes
+        ]
+        if not documents:
+            return 0
+        result = await (await self._collection()).insert_many(documents, ordered=False)
+        return len(result.inserted_ids)
+
+    async def count_pending(self) -> int:
+        return await (await self._collection()).count_documents({'applied_to': None})
+
+    async def pending(self, limit: int) -> List[Dict[str, Any]]:
+        """Oldest outcomes not yet absorbed by any model bundle"""
+        cursor = (await self._collection()).find({'applied_to': None}).sort('received_at', 1).limit(limit)
+        return await cursor.to_list(length=limit)
+
+    async def labeled(self) -> List[Dict[str, Any]]:
+        """Every outcome carrying both labels, for full retrains"""
+        projection = {field: 1 for field in OUTCOME_FIELDS}
+        cursor = (await self._collection()).find(
+            {'salary_cad': {'$ne': None}, 'hired': {'$ne': None}}, projection
+        )
+        return await cursor.to_list(length=None)
+
+    async def mark_applied(self, ids: List[Any], bundle_key: str) -> None:
+        if ids:
+            await (await self._collection()).update_many(
+                {'_id': {'$in': ids}},
+                {'$set': {'applied_to': bundle_key, 'applied_at': datetime.now()}}
+            )
+
+
+def outcomes_frame(outcomes: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Outcome documents as a training frame; missing profile fields take the profile defaults"""
+    frame = pd.DataFrame.from_records(
+        [{field: outcome.get(field) for field in OUTCOME_FIELDS} for outcome in outcomes], columns=OUTCOME_FIELDS
+    )
+    for field in CATEGORICAL_FEATURES + NUMERICAL_FEATURES:
+        frame[field] = frame[field].fillna(PROFILE_DEFAULTS[field])
+    for field in NUMERICAL_FEATURES + LABEL_COLUMNS:
+        frame[field] = pd.to_numeric(frame[field], errors='coerce').astype(float)
+    return frame
+
+
+def measure_drift(predictor_salary, predictor_hired, X: np.ndarray, frame: pd.DataFrame,
+                  baseline: Dict[str, float]) -> Dict[str, float]:
+    """Salary residual bias (in training std units) and hire-rate shift of the new outcomes"""
+    drift = {'salary_drift': 0.0, 'hire_drift': 0.0}
+    salary_rows = frame['salary_cad'].notna().to_numpy()
+    if salary_rows.any():
+        residual = frame['salary_cad'].to_numpy()[salary_rows] - predictor_salary.predict(X[salary_rows])
+        drift['salary_drift'] = float(abs(residual.mean()) / max(baseline['salary_std'], 1.0))
+    hired_rows = frame['hired'].notna().to_numpy()
+    if hired_rows.any():
+        predicted_rate = predictor_hired.predict_proba(X[hired_rows])[:, 1].mean()
+        drift['hire_drift'] = float(abs(frame['hired'].to_numpy()[hired_rows].mean() - predicted_rate))
+    return drift
+
+
+def _size_param(model: Any) -> str:
+    """Parameter holding an ensemble's size: boosting iterations for histogram models, else trees"""
+    return 'max_iter' if 'max_iter' in model.get_params() else 'n_estimators'
+
+
+def _trees_for(n_new: int, n_train: int, base_trees: int, max_new_trees: int) -> int:
+    """New trees in proportion to the new data's share of everything the model has seen"""
+    return int(min(max_new_trees, max(1, math.ceil(base_trees * n_new / max(n_train, 1)))))
+
+
+def warm_start_models(models: Dict[str, Any], base_models: Dict[str, Any], X: np.ndarray, frame: pd.DataFrame,
+                      experience_codes: np.ndarray, n_train: int, policy: UpdatePolicy) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Copies of ``models`` extended with trees fitted on the new rows only. Forests beyond their
+    tree cap drop their oldest trees (compaction); the live models are never mutated.
+    """
+    updated = dict(models)
+    report: Dict[str, Any] = {}
+    targets = {
+        'salary_predictor': frame['salary_cad'].to_numpy(),
+        'job_matcher': frame['hired'].to_numpy(),
+        'career_classifier': experience_codes.astype(float)
+    }
+    for name, y in targets.items():
+        rows = ~np.isnan(y)
+        size_param = _size_param(base_models[name])
+        base_trees = base_models[name].get_params()[size_param]
+        if rows.sum() < policy.min_rows:
+            report[name] = {'trees_added': 0, 'reason': 'not enough labeled rows'}
+            continue
+        y_new = y[rows] if name == 'salary_predictor' else y[rows].astype(int)
+        model = models[name]
+        # Classifiers can only be extended if the new rows cover the same classes
+        if hasattr(model, 'classes_') and not np.array_equal(np.unique(y_new), model.classes_):
+            report[name] = {'trees_added': 0, 'reason': 'new rows do not cover every class'}
+            continue
+
+        new_trees = _trees_for(int(rows.sum()), n_train, base_trees, policy.max_new_trees)
+        model = copy.deepcopy(model)
+        model.set_params(warm_start=True, **{size_param: model.get_params()[size_param] + new_trees})
+        model.fit(X[rows], y_new)
+        model.set_params(warm_start=False)
+
+        compacted = 0
+        cap = int(base_trees * policy.max_tree_growth)
+        if hasattr(model, 'estimators_') and isinstance(model.estimators_, list) and len(model.estimators_) > cap:
+            # Forest compaction: averaging makes trees independent, so the oldest can simply go
+            compacted = len(model.estimators_) - cap
+            model.estimators_ = model.estimators_[compacted:]
+            model.n_estimators = cap
+        updated[name] = model
+        report[name] = {'trees_added': new_trees, 'trees_compacted': compacted, 'rows': int(rows.sum())}
+    return updated, report
+
+
+def booster_overgrown(models: Dict[str, Any], base_models: Dict[str, Any], policy: UpdatePolicy) -> bool:
+    """Boosted stages are additive and cannot be dropped, so a grown booster calls for a retrain"""
+    booster, base = models['salary_predictor'], base_models['salary_predictor']
+    size_param = _size_param(base)
+    return booster.get_params()[size_param] > base.get_params()[size_param] * policy.max_tree_growth
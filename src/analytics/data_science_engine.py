@@ -3,6 +3,7 @@ Data Science Analytics Engine for Workflow Performance Analysis
 """
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 # Temporarily commenting out sklearn imports to fix hanging issue
 # from sklearn.model_selection import train_test_split
 # from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
@@ -34,45 +35,76 @@ def train_test_split(X, y, **kwargs):
 
 def accuracy_score(y_true, y_pred): return 0.85
 
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 import asyncio
-from typing import Dict, List, Any
+import os
+from typing import Dict, Iterable, List, Any
 import logging
 
 from database.mongodb_config import db_manager
+from src.analytics.analytics_cache import SingleFlightCache, data_version
+from src.analytics.metrics_cache import TTLCache
+from src.analytics.workflow_queries import fetch_workflow_summary
+from src.analytics.workflow_reader import DEFAULT_BATCH_SIZE, WORKFLOW_PROJECTION, read_workflow_frame
+from src.analytics.workflow_rollups import fetch_rollup_summary, rollups_ready
+from src.utils.lazy import lazy_module_attributes, lazy_singleton
 
 logger = logging.getLogger(__name__)
 
+# Nested numeric fields flattened into columns: field -> {key: column}
+NESTED_NUMERIC_FIELDS = {
+    'token_usage': {'total_tokens': 'total_tokens', 'completion_tokens': 'completion_tokens'},
+    'user_feedback': {'rating': 'feedback_rating'}
+}
+
+# Whole-number features, stored in the smallest integer dtype that holds them
+INTEGER_FEATURES = ('hour', 'day_of_week', 'month', 'priority_numeric', 'total_tokens', 'completion_tokens')
+
+
+def _nested_numeric(values: pd.Series, keys: Iterable[str]) -> Dict[str, pd.Series]:
+    """
+    ``values[i][key]`` of dict entries as numeric columns, 0 where the entry or key is missing.
+    The dicts are converted in C to one Arrow struct array of just these keys, each then read
+    as a column; values Arrow cannot convert fall back to element-wise ``Series.str.get``.
+    """
+    keys = list(keys)
+    try:
+        struct = pa.array(values.to_numpy(dtype=object), type=pa.struct([(key, pa.float64()) for key in keys]),
+                          from_pandas=True)
+        extracted = {key: pd.Series(struct.field(key).to_numpy(zero_copy_only=False), index=values.index) for key in keys}
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, TypeError):
+        extracted = {key: values.str.get(key) for key in keys}
+    return {key: pd.to_numeric(column, errors='coerce').fillna(0) for key, column in extracted.items()}
+
+
 class DataScienceEngine:
     def __init__(self):
         self.scaler = StandardScaler()
         self.label_encoder = LabelEncoder()
         self.models = {}
+        # Shared by every analytics endpoint; keys carry the workflows data version
+        self.results_cache = SingleFlightCache(TTLCache(
+            max_size=int(os.getenv("ANALYTICS_CACHE_SIZE", "64")),
+            ttl_seconds=float(os.getenv("ANALYTICS_CACHE_TTL_SECONDS", "300"))
+        ))
         
-    async def collect_workflow_data(self, days_back: int = 30) -> pd.DataFrame:
+    async def collect_workflow_data(self, days_back: int = 30, batch_size: int = DEFAULT_BATCH_SIZE) -> pd.DataFrame:
         """Collect workflow data for analysis"""
         try:
             # Calculate date range
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days_back)
+            query = {"created_at": {"$gte": start_date, "$lte": end_date}}
             
-            # Query workflows from MongoDB
-            cursor = db_manager.db.workflows.find({
-                "created_at": {"$gte": start_date, "$lte": end_date}
-            })
+            # Stream only the analysed fields from MongoDB into preallocated columns
+            expected = await db_manager.db.workflows.count_documents(query)
+            cursor = db_manager.db.workflows.find(query, WORKFLOW_PROJECTION, batch_size=batch_size)
+            df = await read_workflow_frame(cursor, expected=expected, batch_size=batch_size)
             
-            workflows = await cursor.to_list(length=None)
-            
-            if not workflows:
+            if df.empty:
                 logger.warning("No workflow data found")
                 return pd.DataFrame()
             
-            # Convert to DataFrame
-            df = pd.DataFrame(workflows)
-            
             # Data preprocessing
             df = self._preprocess_workflow_data(df)
             
@@ -83,6 +115,39 @@ class DataScienceEngine:
             logger.error(f"Error collecting workflow data: {e}")
             return pd.DataFrame()
     
+    async def _cached(self, name: str, days_back: int, compute) -> Any:
+        """One computation per (name, window, data version), however many endpoints ask concurrently"""
+        version = await data_version(db_manager.db)
+        return await self.results_cache.get_or_compute((name, days_back, version), compute)
+    
+    async def workflow_summary(self, days_back: int = 30) -> Dict[str, Any]:
+        """Cached workflow summary for the last ``days_back`` days"""
+        return await self._cached("summary", days_back, lambda: self._workflow_summary(days_back))
+    
+    async def ml_insights(self, days_back: int = 30) -> Dict[str, Any]:
+        """Cached success model and clustering, fitted on every workflow of the window"""
+        return await self._cached("ml", days_back, lambda: self._ml_insights(days_back))
+    
+    async def _ml_insights(self, days_back: int) -> Dict[str, Any]:
+        df = await self.collect_workflow_data(days_back=days_back)
+        return {
+            "predictions": await self.predict_workflow_success(df),
+            "clustering": await self.cluster_workflow_patterns(df),
+            "data_summary": {
+                "total_samples": len(df),
+                "date_range": f"{df['created_at'].min()} to {df['created_at'].max()}" if 'created_at' in df.columns else "N/A",
+                "avg_success_score": df['success_score'].mean() if 'success_score' in df.columns else 0
+            }
+        }
+    
+    async def _workflow_summary(self, days_back: int) -> Dict[str, Any]:
+        """Counts, patterns and success statistics from the rollups, or aggregated over raw workflows until they are backfilled"""
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days_back)
+        if await rollups_ready(db_manager.db):
+            return await fetch_rollup_summary(db_manager.db, start_date, end_date)
+        return await fetch_workflow_summary(db_manager.db.workflows, start_date, end_date)
+    
     def _preprocess_workflow_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Preprocess workflow data for analysis"""
         try:
@@ -93,14 +158,12 @@ class DataScienceEngine:
                 df['day_of_week'] = df['created_at'].dt.dayofweek
                 df['month'] = df['created_at'].dt.month
             
-            # Extract numeric features from token_usage
-            if 'token_usage' in df.columns:
-                df['total_tokens'] = df['token_usage'].apply(
-                    lambda x: x.get('total_tokens', 0) if isinstance(x, dict) else 0
-                )
-                df['completion_tokens'] = df['token_usage'].apply(
-                    lambda x: x.get('completion_tokens', 0) if isinstance(x, dict) else 0
-                )
+            # Flatten token_usage / user_feedback into numeric columns (already flat when streamed)
+            for field, keys in NESTED_NUMERIC_FIELDS.items():
+                wanted = {key: column for key, column in keys.items() if column not in df.columns}
+                if field in df.columns and wanted:
+                    for key, values in _nested_numeric(df[field], wanted).items():
+                        df[wanted[key]] = values
             
             # Calculate success score based on execution time and user feedback
             df['success_score'] = self._calculate_success_score(df)
@@ -110,9 +173,15 @@ class DataScienceEngine:
                 'low': 1, 'medium': 2, 'high': 3, 'urgent': 4
             }).fillna(2)
             
-            # Fill missing values
+            # Fill missing values; medians only for the columns that have gaps
             numeric_columns = df.select_dtypes(include=[np.number]).columns
-            df[numeric_columns] = df[numeric_columns].fillna(df[numeric_columns].median())
+            missing = numeric_columns[df[numeric_columns].isna().any().to_numpy()]
+            if len(missing):
+                df[missing] = df[missing].fillna(df[missing].median())
+            
+            for column in INTEGER_FEATURES:
+                if column in df.columns:
+                    df[column] = pd.to_numeric(df[column], downcast='integer')
             
             categorical_columns = df.select_dtypes(include=['object']).columns
             df[categorical_columns] = df[categorical_columns].fillna('unknown')
@@ -142,11 +211,10 @@ class DataScienceEngine:
                 base_score = base_score - time_penalty
             
             # Adjust based on user feedback if available
-            if 'user_feedback' in df.columns:
-                feedback_bonus = df['user_feedback'].apply(
-                    lambda x: x.get('rating', 0) * 5 if isinstance(x, dict) else 0
-                )
-                base_score = base_score + feedback_bonus
+            if 'feedback_rating' in df.columns:
+                base_score = base_score + df['feedback_rating'] * 5
+            elif 'user_feedback' in df.columns:
+                base_score = base_score + _nested_numeric(df['user_feedback'], ['rating'])['rating'] * 5
             
             return base_score.clip(0, 100)
             
@@ -224,7 +292,9 @@ class DataScienceEngine:
             if len(available_features) < 3:
                 return {"error": "Insufficient features for clustering"}
             
-            X = df[available_features].fillna(df[available_features].median())
+            X = df[available_features]
+            if X.isna().to_numpy().any():
+                X = X.fillna(X.median())
             
             # Standardize features
             X_scaled = self.scaler.fit_transform(X)
@@ -266,38 +336,36 @@ class DataScienceEngine:
     async def generate_analytics_dashboard_data(self) -> Dict[str, Any]:
         """Generate comprehensive analytics data for dashboard"""
         try:
-            # Collect data
-            df = await self.collect_workflow_data(days_back=30)
+            # Summaries are aggregated server-side ($match -> $group); only grouped rows come back
+            summary = await self.workflow_summary(days_back=30)
             
-            if df.empty:
+            if not summary['total']:
                 return {"error": "No data available for analytics"}
             
             # Basic statistics
-            total_workflows = len(df)
-            avg_success_score = df['success_score'].mean()
-            completion_rate = (df['status'] == 'completed').mean() * 100
-            
-            # Time series data
-            daily_counts = df.groupby(df['created_at'].dt.date).size().reset_index()
-            daily_counts.columns = ['date', 'count']
+            total_workflows = summary['total']
+            avg_success_score = summary['avg_success_score']
+            completion_rate = summary['completed'] / total_workflows * 100
             
             # Success by priority
-            priority_success = df.groupby('priority')['success_score'].mean().reset_index()
-            
-            # Hourly patterns
-            hourly_patterns = df.groupby('hour').size().reset_index()
-            hourly_patterns.columns = ['hour', 'count']
+            priority_success = [
+                {"priority": row['_id'], "success_score": row['avg_success_score']} for row in summary['priority']
+            ]
             
             # Industry analysis if available
             industry_analysis = {}
-            if 'industry' in df.columns:
-                industry_analysis = df.groupby('industry')['success_score'].agg([
-                    'mean', 'count', 'std'
-                ]).round(2).to_dict()
+            industries = summary['industry']
+            if any(row['_id'] != 'unknown' for row in industries):
+                industry_analysis = {
+                    "mean": {row['_id']: round(row['mean'], 2) for row in industries},
+                    "count": {row['_id']: row['count'] for row in industries},
+                    "std": {row['_id']: round(row['std'], 2) if row['std'] is not None else None for row in industries}
+                }
             
-            # ML predictions
-            prediction_results = await self.predict_workflow_success(df)
-            clustering_results = await self.cluster_workflow_patterns(df)
+            # ML predictions on the full window, shared with /analytics/ml-insights
+            ml_results = await self.ml_insights(days_back=30)
+            prediction_results = ml_results['predictions']
+            clustering_results = ml_results['clustering']
             
             return {
                 "summary_stats": {
@@ -306,9 +374,9 @@ class DataScienceEngine:
                     "completion_rate": round(completion_rate, 2),
                     "data_range_days": 30
                 },
-                "time_series": daily_counts.to_dict('records'),
-                "priority_analysis": priority_success.to_dict('records'),
-                "hourly_patterns": hourly_patterns.to_dict('records'),
+                "time_series": summary['daily_counts'],
+                "priority_analysis": priority_success,
+                "hourly_patterns": summary['hourly_counts'],
                 "industry_analysis": industry_analysis,
                 "ml_predictions": prediction_results,
                 "clustering_analysis": clustering_results,
@@ -319,5 +387,6 @@ class DataScienceEngine:
             logger.error(f"Error generating analytics: {e}")
             return {"error": str(e)}
 
-# Global analytics engine
-analytics_engine = DataScienceEngine()
+# Global instance, built on first use so importing this module stays cheap
+get_analytics_engine = lazy_singleton(DataScienceEngine)
+__getattr__ = lazy_module_attributes(__name__, analytics_engine=get_analytics_engine)  # Backwards compatible `from ... import analytics_engine`
@@ -0,0 +1,157 @@
+"""
+Career Feature Pipeline - One fitted object for encoding and scaling career profiles
+Categorical vocabularies, column order, defaults and scaling live together and are persisted
+with the models, so training, single-row and batch inference all encode profiles identically.
+"""
+from typing import Any, Dict, List, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+CATEGORICAL_FEATURES = ['city', 'industry', 'experience_level', 'education']
+NUMERICAL_FEATURES = ['python_skill', 'sql_skill', 'ml_skill', 'communication_skill',
+                      'portfolio_projects', 'github_commits', 'years_experience']
+
+# Values assumed for fields a profile leaves out
+PROFILE_DEFAULTS = {
+    'city': 'Toronto',
+    'industry': 'Tech',
+    'experience_level': 'Junior',
+    'education': 'Bachelor',
+    'python_skill': 5.0,
+    'sql_skill': 5.0,
+    'ml_skill': 3.0,
+    'communication_skill': 6.0,
+    'portfolio_projects': 2,
+    'github_commits': 50,
+    'years_experience': 2.0
+}
+
+# Below this many rows, dictionary lookups beat building a pandas Categorical
+_SMALL_BATCH = 256
+
+ProfileData = Union[Dict[str, Any], List[Dict[str, Any]], pd.DataFrame]
+
+
+def profile_columns(data: ProfileData, fields: Sequence[str] = tuple(PROFILE_DEFAULTS)) -> Dict[str, np.ndarray]:
+    """
+    Column arrays for a single profile, a list of profiles or a DataFrame.
+    Missing values are None in categorical columns and NaN in numeric ones.
+    """
+    if isinstance(data, dict):
+        data = [data]
+
+    columns = {}
+    if isinstance(data, pd.DataFrame):
+        for field in fields:
+            if field in data:
+                values = data[field].to_numpy()
+            else:
+                values = np.full(len(data), None, dtype=object)
+            columns[field] = values if field in CATEGORICAL_FEATURES else values.astype(float)
+        return columns
+
+    for field in fields:
+        if field in CATEGORICAL_FEATURES:
+            columns[field] = np.array([profile.get(field) for profile in data], dtype=object)
+        else:
+            columns[field] = np.array([profile.get(field) for profile in data], dtype=float)
+    return columns
+
+
+def fill_column(columns: Dict[str, np.ndarray], field: str, default: Any, length: int) -> np.ndarray:
+    """A profile column with ``default`` substituted for missing values"""
+    values = columns.get(field)
+    if values is None:
+        return np.full(length, default, dtype=object if isinstance(default, str) else float)
+    missing = pd.isna(values)
+    if not missing.any():
+        return values
+    if values.dtype == object:
+        values = values.copy()
+        values[missing] = default
+        return values
+    return np.where(missing, default, values)
+
+
+def lookup(values: np.ndarray, table: Dict[Any, float], fallback: float) -> np.ndarray:
+    """Vectorized dictionary lookup with a fallback for unknown keys"""
+    if len(values) <= _SMALL_BATCH:
+        return np.array([table.get(v, fallback) for v in values], dtype=float)
+    return pd.Series(values).map(table).fillna(fallback).to_numpy(dtype=float)
+
+
+class CareerFeaturePipeline:
+    """Fitted categorical encoding plus standard scaling for the career models"""
+
+    def __init__(self, defaults: Dict[str, Any] = None):
+        self.defaults = {**PROFILE_DEFAULTS, **(defaults or {})}
+        self.categorical_features = list(CATEGORICAL_FEATURES)
+        self.numerical_features = list(NUMERICAL_FEATURES)
+        self.vocabularies: Dict[str, List[str]] = {}
+        self._codes: Dict[str, Dict[str, int]] = {}
+        self.scaler = StandardScaler()
+        self.mean_ = None
+        self.scale_ = None
+
+    @property
+    def feature_names(self) -> List[str]:
+        return self.categorical_features + self.numerical_features
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.mean_ is not None
+
+    def fit(self, df: pd.DataFrame) -> 'CareerFeaturePipeline':
+        """Learn category vocabularies (sorted, as LabelEncoder would) and scaling statistics"""
+        for feature in self.categorical_features:
+            self.vocabularies[feature] = sorted(str(v) for v in df[feature].dropna().unique())
+            self._codes[feature] = {value: code for code, value in enumerate(self.vocabularies[feature])}
+        self.scaler.fit(self.encode(df))
+        self.mean_ = np.asarray(self.scaler.mean_, dtype=float)
+        self.scale_ = np.asarray(self.scaler.scale_, dtype=float)
+        return self
+
+    def category_codes(self, feature: str, values: np.ndarray) -> np.ndarray:
+        """Integer codes for a categorical column; unknown values get the default's code"""
+        codes = self._codes[feature]
+        default_code = codes.get(self.defaults[feature], 0)
+        if len(values) <= _SMALL_BATCH:
+            return np.array([codes.get(v, default_code) for v in values], dtype=float)
+        encoded = pd.Categorical(values, categories=self.vocabularies[feature]).codes.astype(float)
+        encoded[encoded < 0] = default_code
+        return encoded
+
+    def decode(self, feature: str, codes: np.ndarray) -> np.ndarray:
+        """Category labels for integer codes"""
+        return np.asarray(self.vocabularies[feature], dtype=object)[np.asarray(codes, dtype=int)]
+
+    def encode(self, data: ProfileData) -> np.ndarray:
+        """Unscaled feature matrix in ``feature_names`` order"""
+        return self.encode_columns(profile_columns(data, self.feature_names))
+
+    def encode_columns(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """Unscaled feature matrix from already extracted profile columns"""
+        n_rows = len(next(iter(columns.values())))
+        matrix = np.empty((n_rows, len(self.feature_names)), dtype=float)
+        for i, feature in enumerate(self.categorical_features):
+            matrix[:, i] = self.category_codes(feature, fill_column(columns, feature, self.defaults[feature], n_rows))
+        offset = len(self.categorical_features)
+        for i, feature in enumerate(self.numerical_features):
+            matrix[:, offset + i] = fill_column(columns, feature, self.defaults[feature], n_rows)
+        return matrix
+
+    def transform(self, data: ProfileData) -> np.ndarray:
+        """Scaled, C-contiguous float64 feature matrix ready for the models"""
+        return self.transform_columns(profile_columns(data, self.feature_names))
+
+    def transform_columns(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """Scaled feature matrix from already extracted profile columns"""
+        matrix = self.encode_columns(columns)
+        matrix -= self.mean_
+        matrix /= self.scale_
+        return matrix
+
+    def fit_transform(self, df: pd.DataFrame) -> np.ndarray:
+        return self.fit(df).transform(df)
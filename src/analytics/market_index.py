@@ -0,0 +1,132 @@
+"""
+Market Segment Index - Precomputed salary distributions and rates per market segment
+Built once per dataset version so percentile lookups are a binary search and market
+statistics are dictionary reads, independent of how large the market dataset grows.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class SegmentStats:
+    """Sorted salaries and cached aggregates for one market segment"""
+    sorted_salary_cad: np.ndarray
+    count: int
+    avg_salary_cad: float
+    avg_salary_local: float
+    remote_rate: float
+    hiring_rate: float
+
+    def salary_percentile(self, salary: float) -> float:
+        """Percentage of the segment earning strictly less than ``salary``"""
+        if self.count == 0:
+            return float('nan')
+        return float(np.searchsorted(self.sorted_salary_cad, salary, side='left')) / self.count * 100
+
+
+class MarketSegmentIndex:
+    """Per (city, industry), per city and per industry segment statistics"""
+
+    COLUMNS = ['city', 'industry', 'salary_cad', 'salary_local', 'remote_work_available', 'hired']
+
+    def __init__(self, version: str, by_city_industry: Dict[Tuple[str, str], SegmentStats],
+                 by_city: Dict[str, SegmentStats], by_industry: Dict[str, SegmentStats]):
+        self.version = version
+        self.by_city_industry = by_city_industry
+        self.by_city = by_city
+        self.by_industry = by_industry
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, version: str) -> 'MarketSegmentIndex':
+        """Sort salaries once and split them into every segment in a single pass per grouping"""
+        market = df[cls.COLUMNS].sort_values('salary_cad', kind='stable')
+        return cls(
+            version=version,
+            by_city_industry=cls._group_stats(market, ['city', 'industry']),
+            by_city=cls._group_stats(market, 'city'),
+            by_industry=cls._group_stats(market, 'industry')
+        )
+
+    @classmethod
+    def build_from_batches(cls, batches: Iterable[pd.DataFrame], version: str) -> 'MarketSegmentIndex':
+        """
+        Same index from column-projected chunks of a dataset too large for one DataFrame.
+        Only the salary column (per segment) and running sums are kept in memory; city and
+        industry segments are merged from their (city, industry) parts.
+        """
+        rate_columns = ['salary_cad', 'salary_local', 'remote_work_available', 'hired']
+        salaries: Dict[Tuple[str, str], List[np.ndarray]] = {}
+        totals: Dict[Tuple[str, str], np.ndarray] = {}  # count followed by the rate_columns sums
+        for chunk in batches:
+            chunk_salaries = chunk['salary_cad'].to_numpy(dtype=float)
+            grouped = chunk.groupby(['city', 'industry'], sort=False, observed=True)
+            sums = grouped[rate_columns].sum()
+            counts = grouped.size()
+            for key, positions in grouped.indices.items():
+                salaries.setdefault(key, []).append(chunk_salaries[positions])
+                chunk_totals = np.concatenate([[counts.loc[key]], sums.loc[key].to_numpy(dtype=float)])
+                totals[key] = totals[key] + chunk_totals if key in totals else chunk_totals
+
+        def merge(keys) -> SegmentStats:
+            sorted_salaries = np.sort(np.concatenate([part for key in keys for part in salaries[key]]))
+            count, salary_cad, salary_local, remote, hired = np.sum([totals[key] for key in keys], axis=0)
+            return SegmentStats(
+                sorted_salary_cad=sorted_salaries,
+                count=int(count),
+                avg_salary_cad=float(salary_cad / count),
+                avg_salary_local=float(salary_local / count),
+                remote_rate=float(remote / count),
+                hiring_rate=float(hired / count)
+            )
+
+        cities, industries = {}, {}
+        for city, industry in totals:
+            cities.setdefault(city, []).append((city, industry))
+            industries.setdefault(industry, []).append((city, industry))
+        return cls(
+            version=version,
+            by_city_industry={key: merge([key]) for key in totals},
+            by_city={city: merge(keys) for city, keys in cities.items()},
+            by_industry={industry: merge(keys) for industry, keys in industries.items()}
+        )
+
+    @staticmethod
+    def _group_stats(market: pd.DataFrame, keys) -> Dict:
+        # Groups keep the frame's row order, so each group's salaries are already sorted
+        salaries = market['salary_cad'].to_numpy(dtype=float)
+        grouped = market.groupby(keys, sort=False, observed=True)
+        aggregates = grouped.agg(
+            avg_salary_cad=('salary_cad', 'mean'),
+            avg_salary_local=('salary_local', 'mean'),
+            remote_rate=('remote_work_available', 'mean'),
+            hiring_rate=('hired', 'mean')
+        )
+        stats = {}
+        for key, positions in grouped.indices.items():
+            row = aggregates.loc[key]
+            stats[key] = SegmentStats(
+                sorted_salary_cad=salaries[positions],
+                count=len(positions),
+                avg_salary_cad=float(row['avg_salary_cad']),
+                avg_salary_local=float(row['avg_salary_local']),
+                remote_rate=float(row['remote_rate']),
+                hiring_rate=float(row['hiring_rate'])
+            )
+        return stats
+
+    def city_industry(self, city: str, industry: str) -> Optional[SegmentStats]:
+        return self.by_city_industry.get((city, industry))
+
+    def city(self, city: str) -> Optional[SegmentStats]:
+        return self.by_city.get(city)
+
+    def industry(self, industry: str) -> Optional[SegmentStats]:
+        return self.by_industry.get(industry)
+
+    def salary_percentile(self, city: str, industry: str, salary: float) -> float:
+        """Salary percentile among profiles in the same city and industry"""
+        segment = self.city_industry(city, industry)
+        return segment.salary_percentile(salary) if segment else float('nan')
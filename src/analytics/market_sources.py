@@ -0,0 +1,238 @@
+"""
+Market Data Sources - Where the Career Intelligence market dataset comes from
+The in-process synthetic generator is one source; Parquet and Arrow IPC files are others.
+File sources are memory-mapped and read with column projection in bounded chunks, so the
+engine builds its market index by streaming and trains on a seeded subsample instead of
+holding tens of millions of rows in a pandas DataFrame.
+"""
+import abc
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.analytics.model_store import ModelArtifactStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_ROWS = 1_000_000
+
+# Columns the engine needs from a real market dataset
+TRAINING_COLUMNS = [
+    'city', 'industry', 'experience_level', 'education',
+    'python_skill', 'sql_skill', 'ml_skill', 'communication_skill',
+    'portfolio_projects', 'github_commits', 'years_experience',
+    'salary_cad', 'salary_local', 'remote_work_available', 'hired'
+]
+
+
+class MarketSource(abc.ABC):
+    """A market dataset that can be streamed in column-projected chunks"""
+
+    kind = 'base'
+    # In-memory sources hand the engine their full DataFrame; file sources are streamed
+    in_memory = False
+
+    @abc.abstractmethod
+    def num_rows(self) -> int:
+        ...
+
+    @abc.abstractmethod
+    def column_names(self) -> List[str]:
+        ...
+
+    @abc.abstractmethod
+    def fingerprint(self) -> str:
+        """Identity of the full dataset, cheap enough to compute on every startup"""
+
+    @abc.abstractmethod
+    def iter_batches(self, columns: Sequence[str], batch_rows: int = DEFAULT_BATCH_ROWS) -> Iterator[pd.DataFrame]:
+        ...
+
+    def take(self, rows: np.ndarray, columns: Sequence[str]) -> pd.DataFrame:
+        """Rows at sorted positions ``rows``; the default streams chunks and keeps the hits"""
+        parts, offset = [], 0
+        for chunk in self.iter_batches(columns):
+            end = offset + len(chunk)
+            lo, hi = np.searchsorted(rows, [offset, end])
+            if hi > lo:
+                parts.append(chunk.iloc[rows[lo:hi] - offset])
+            offset = end
+        return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=list(columns))
+
+    def training_frame(self, max_rows: int, seed: int, columns: Sequence[str] = TRAINING_COLUMNS) -> pd.DataFrame:
+        """All rows if they fit in ``max_rows``, otherwise a seeded uniform subsample"""
+        n_rows = self.num_rows()
+        if n_rows <= max_rows:
+            return pd.concat(self.iter_batches(columns), ignore_index=True)
+        rows = np.sort(np.random.default_rng(seed).choice(n_rows, size=max_rows, replace=False))
+        logger.info(f"🎯 Sampling {max_rows:,} of {n_rows:,} market rows for training")
+        return self.take(rows, columns)
+
+    def dataset_version(self, max_rows: int, seed: int) -> str:
+        """Version of the training frame: the source fingerprint, plus sampling parameters if subsampled"""
+        fingerprint = self.fingerprint()
+        if self.num_rows() <= max_rows:
+            return fingerprint
+        return hashlib.sha256(f"{fingerprint}:{max_rows}:{seed}".encode()).hexdigest()
+
+    def cache_key(self, max_rows: int, seed: int) -> str:
+        """Short, filesystem-safe key for the training frame"""
+        return f"{self.kind}_{self.dataset_version(max_rows, seed)[:20]}"
+
+    def describe(self) -> dict:
+        return {'kind': self.kind, 'rows': self.num_rows()}
+
+
+class SyntheticMarketSource(MarketSource):
+    """The seeded in-process generator, materialized once on first use"""
+
+    kind = 'synthetic'
+    in_memory = True
+
+    def __init__(self, generator: Callable[..., pd.DataFrame], n_samples: int = 3000, seed: int = 42):
+        self.generator = generator
+        self.n_samples = n_samples
+        self.seed = seed
+        self._df: Optional[pd.DataFrame] = None
+        self._fingerprint: Optional[str] = None
+
+    @property
+    def df(self) -> pd.DataFrame:
+        if self._df is None:
+            self._df = self.generator(n_samples=self.n_samples, seed=self.seed)
+        return self._df
+
+    def num_rows(self) -> int:
+        return self.n_samples
+
+    def column_names(self) -> List[str]:
+        return list(self.df.columns)
+
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = ModelArtifactStore.dataset_hash(self.df)
+        return self._fingerprint
+
+    def iter_batches(self, columns: Sequence[str], batch_rows: int = DEFAULT_BATCH_ROWS) -> Iterator[pd.DataFrame]:
+        df = self.df[list(columns)]
+        for start in range(0, len(df), batch_rows):
+            yield df.iloc[start:start + batch_rows]
+
+    def training_frame(self, max_rows: int, seed: int, columns: Sequence[str] = TRAINING_COLUMNS) -> pd.DataFrame:
+        # The generator is the full dataset with every derived column, exactly as before
+        if self.n_samples <= max_rows:
+            return self.df
+        rows = np.sort(np.random.default_rng(seed).choice(self.n_samples, size=max_rows, replace=False))
+        return self.df.iloc[rows].reset_index(drop=True)
+
+    def cache_key(self, max_rows: int, seed: int) -> str:
+        # Known without generating the data, so attaching workers never run the generator
+        return f"{self.kind}_{self.n_samples}_{self.seed}_{min(max_rows, self.n_samples)}"
+
+
+class ParquetMarketSource(MarketSource):
+    """Parquet file read through a memory map, one record batch at a time"""
+
+    kind = 'parquet'
+
+    def __init__(self, path: str):
+        import pyarrow.parquet as pq
+
+        self.path = Path(path)
+        self._file = pq.ParquetFile(self.path, memory_map=True)
+
+    def num_rows(self) -> int:
+        return self._file.metadata.num_rows
+
+    def column_names(self) -> List[str]:
+        return self._file.schema_arrow.names
+
+    def fingerprint(self) -> str:
+        # The footer (schema, row groups and their column statistics) identifies the content
+        metadata = self._file.metadata
+        footer = {
+            'schema': str(self._file.schema_arrow),
+            'row_groups': [metadata.row_group(i).to_dict() for i in range(metadata.num_row_groups)]
+        }
+        return hashlib.sha256(json.dumps(footer, sort_keys=True, default=str).encode()).hexdigest()
+
+    def iter_batches(self, columns: Sequence[str], batch_rows: int = DEFAULT_BATCH_ROWS) -> Iterator[pd.DataFrame]:
+        for batch in self._file.iter_batches(batch_size=batch_rows, columns=list(columns)):
+            yield batch.to_pandas()
+
+
+class ArrowIPCMarketSource(MarketSource):
+    """Arrow IPC (Feather v2) file; record batches are zero-copy views into the memory map"""
+
+    kind = 'arrow'
+
+    def __init__(self, path: str):
+        import pyarrow as pa
+
+        self.path = Path(path)
+        self._table = pa.ipc.open_file(pa.memory_map(str(self.path), 'r')).read_all()
+
+    def num_rows(self) -> int:
+        return self._table.num_rows
+
+    def column_names(self) -> List[str]:
+        return self._table.column_names
+
+    def fingerprint(self) -> str:
+        stat = self.path.stat()
+        identity = f"{self.path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}:{self._table.schema}:{self.num_rows()}"
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def iter_batches(self, columns: Sequence[str], batch_rows: int = DEFAULT_BATCH_ROWS) -> Iterator[pd.DataFrame]:
+        for batch in self._table.select(list(columns)).to_batches(max_chunksize=batch_rows):
+            yield batch.to_pandas()
+
+    def take(self, rows: np.ndarray, columns: Sequence[str]) -> pd.DataFrame:
+        return self._table.select(list(columns)).take(rows).to_pandas()
+
+
+def open_market_source(generator: Callable[..., pd.DataFrame], n_samples: int = 3000, seed: int = 42,
+                       path: Optional[str] = None) -> MarketSource:
+    """The market source for ``path`` (or ``CAREER_MARKET_PATH``); synthetic data if neither is set"""
+    path = path or os.getenv("CAREER_MARKET_PATH")
+    if not path:
+        return SyntheticMarketSource(generator, n_samples=n_samples, seed=seed)
+    suffix = Path(path).suffix.lower()
+    if suffix in ('.parquet', '.pq'):
+        source = ParquetMarketSource(path)
+    elif suffix in ('.arrow', '.feather', '.ipc'):
+        source = ArrowIPCMarketSource(path)
+    else:
+        raise ValueError(f"Unsupported market data format: {path} (expected .parquet or .arrow)")
+    missing = sorted(set(TRAINING_COLUMNS) - set(source.column_names()))
+    if missing:
+        raise ValueError(f"Market dataset {path} is missing columns: {missing}")
+    logger.info(f"📂 Market data source: {source.kind} {path} ({source.num_rows():,} rows)")
+    return source
+
+
+if __name__ == "__main__":
+    # Export the synthetic market as Parquet/Arrow, e.g. to try the file sources at scale:
+    #   python -m src.analytics.market_sources market.parquet 10000000
+    import sys
+
+    sys.path.append('.')
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from src.analytics.career_intelligence_engine import CareerIntelligenceEngine
+
+    target = sys.argv[1] if len(sys.argv) > 1 else 'market.parquet'
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+    table = pa.Table.from_pandas(CareerIntelligenceEngine._initialize_market_data(n_samples=rows), preserve_index=False)
+    if target.endswith('.parquet'):
+        pq.write_table(table, target, row_group_size=DEFAULT_BATCH_ROWS)
+    else:
+        with pa.ipc.new_file(target, table.schema) as writer:
+            writer.write_table(table, max_chunksize=DEFAULT_BATCH_ROWS)
+    print(f"Wrote {rows:,} market rows to {target}")
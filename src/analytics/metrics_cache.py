@@ -0,0 +1,113 @@
+"""
+Career Metrics Cache - Bounded LRU + TTL memoization keyed by canonical profiles
+Profiles are canonicalized (categoricals normalized, numeric skills quantized) so that
+identical and near-identical requests share one computed result.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Tuple
+
+CATEGORICAL_FIELDS = ('city', 'industry', 'experience_level', 'education')
+QUANTIZED_FIELDS = ('python_skill', 'sql_skill', 'ml_skill', 'communication_skill', 'years_experience')
+COUNT_FIELDS = ('portfolio_projects', 'github_commits')
+
+_MISSING = object()
+
+
+def quantize(value: Any, resolution: float) -> Any:
+    """Snap a numeric value to the nearest multiple of ``resolution``"""
+    if resolution <= 0 or isinstance(value, bool) or not isinstance(value, (int, float)):
+        return value
+    return round(round(value / resolution) * resolution, 10)
+
+
+def canonicalize_profile(profile: Dict[str, Any], vocabularies: Dict[str, Dict[str, str]],
+                         resolution: float) -> Dict[str, Any]:
+    """
+    Normalized copy of a profile: categoricals are stripped and matched case-insensitively
+    against the known vocabulary, skills are quantized to ``resolution``
+    """
+    canonical = dict(profile)
+    for field in CATEGORICAL_FIELDS:
+        value = profile.get(field)
+        if isinstance(value, str):
+            stripped = value.strip()
+            canonical[field] = vocabularies.get(field, {}).get(stripped.lower(), stripped)
+    for field in QUANTIZED_FIELDS:
+        if field in profile:
+            canonical[field] = quantize(profile[field], resolution)
+    return canonical
+
+
+def profile_cache_key(canonical: Dict[str, Any]) -> Tuple:
+    """Hashable key over the fields that influence career predictions"""
+    return tuple(
+        (field, canonical.get(field))
+        for field in CATEGORICAL_FIELDS + QUANTIZED_FIELDS + COUNT_FIELDS
+    )
+
+
+class TTLCache:
+    """Thread-safe bounded LRU cache whose entries also expire after ``ttl_seconds``"""
+
+    def __init__(self, max_size: int = 4096, ttl_seconds: float = 300.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'invalidations': 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        if not self.enabled:
+            return default
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self._counters['misses'] += 1
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self._counters['expirations'] += 1
+                self._counters['misses'] += 1
+                return default
+            self._entries.move_to_end(key)
+            self._counters['hits'] += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._counters['evictions'] += 1
+
+    def clear(self) -> None:
+        """Drop every entry (e.g. after the underlying models change)"""
+        with self._lock:
+            self._entries.clear()
+            self._counters['invalidations'] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._counters['hits'] + self._counters['misses']
+            return {
+                **self._counters,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl_seconds': self.ttl_seconds,
+                'hit_rate': round(self._counters['hits'] / lookups, 4) if lookups else 0.0
+            }
+
+
+def build_vocabularies(columns: Dict[str, Iterable[str]]) -> Dict[str, Dict[str, str]]:
+    """Case-insensitive lookup tables from the known categorical values"""
+    return {field: {str(v).lower(): str(v) for v in values} for field, values in columns.items()}
@@ -0,0 +1,90 @@
+"""
+Micro-Batcher - Coalesce concurrent single-item calls into one vectorized call
+Requests that arrive within a short window (or until the batch is full) share one
+batch function invocation, and each caller receives its own result.
+"""
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """Collects awaiting callers and flushes them through ``batch_fn`` together"""
+
+    def __init__(self, batch_fn: Callable[[List[Any]], List[Any]], max_batch_size: int = 64, max_wait_ms: float = 2.0):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max(0.0, max_wait_ms)
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats = {'batches': 0, 'items': 0, 'max_batch_size_seen': 0, 'fallbacks': 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_wait_ms > 0 and self.max_batch_size > 1
+
+    async def submit(self, item: Any) -> Any:
+        """Queue one item and wait for its result from the next flushed batch"""
+        if not self.enabled:
+            return self.batch_fn([item])[0]
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A new event loop (e.g. a fresh asyncio.run) must not inherit another loop's timer
+            self._pending = []
+            self._timer = None
+            self._loop = loop
+
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_ms / 1000, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Run one batch and fan the results back to the waiting futures"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if not batch:
+            return
+
+        self._stats['batches'] += 1
+        self._stats['items'] += len(batch)
+        self._stats['max_batch_size_seen'] = max(self._stats['max_batch_size_seen'], len(batch))
+
+        try:
+            results = self.batch_fn([item for item, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+                return
+            # Isolate the failing input so one bad request does not fail its neighbours
+            logger.warning(f"Micro-batch of {len(batch)} failed ({e}), retrying items individually")
+            self._stats['fallbacks'] += 1
+            for item, future in batch:
+                try:
+                    future.set_result(self.batch_fn([item])[0])
+                except Exception as item_error:
+                    future.set_exception(item_error)
+            return
+
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """Batching counters for monitoring"""
+        batches = self._stats['batches']
+        return {
+            **self._stats,
+            'avg_batch_size': round(self._stats['items'] / batches, 2) if batches else 0.0,
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait_ms
+        }
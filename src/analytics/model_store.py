@@ -0,0 +1,116 @@
+"""
+Model Artifact Store - Persisted, versioned Career Intelligence models
+Fitted estimators and their feature pipeline are written to disk under a key derived from
+the training dataset and hyperparameters, so processes load them instead of refitting.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections.abc import Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Any, Iterator, Optional
+
+import joblib
+import pandas as pd
+import sklearn
+
+logger = logging.getLogger(__name__)
+
+# Bump when the artifact layout changes so stale files are never loaded
+ARTIFACT_FORMAT_VERSION = 2
+# Estimator parameters that change how a fit runs, not what it produces
+EXECUTION_PARAMS = ('n_jobs', 'verbose')
+
+
+class ModelArtifactStore:
+    """Directory of versioned model bundles, one joblib file per artifact key"""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = Path(root or os.getenv("CAREER_MODEL_DIR", "./models/career_intelligence"))
+
+    @staticmethod
+    def dataset_hash(df: pd.DataFrame) -> str:
+        """Stable content hash of a training DataFrame"""
+        row_hashes = pd.util.hash_pandas_object(df, index=True).values
+        digest = hashlib.sha256(row_hashes.tobytes())
+        digest.update(json.dumps(list(map(str, df.columns))).encode())
+        return digest.hexdigest()
+
+    @classmethod
+    def build_key(cls, dataset_hash: str, models: Dict[str, Any], extra: Optional[Dict[str, Any]] = None) -> str:
+        """Artifact key from dataset hash, estimator hyperparameters and library versions"""
+        fingerprint = {
+            'format_version': ARTIFACT_FORMAT_VERSION,
+            'sklearn_version': sklearn.__version__,
+            'dataset': dataset_hash,
+            'hyperparameters': {name: cls._fit_params(model) for name, model in sorted(models.items())},
+            'extra': extra or {}
+        }
+        payload = json.dumps(fingerprint, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()[:20]
+
+    @staticmethod
+    def _fit_params(model: Any) -> Dict[str, Any]:
+        """Hyperparameters that affect the fitted model (parallelism settings do not)"""
+        return {name: value for name, value in model.get_params().items() if name not in EXECUTION_PARAMS}
+
+    def path_for(self, key: str) -> Path:
+        return self.root / f"career_models_{key}.joblib"
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load the artifact stored under ``key``, or None if it is missing or unreadable"""
+        path = self.path_for(key)
+        if not path.exists():
+            return None
+        try:
+            artifact = joblib.load(path)
+            if artifact.get('key') != key:
+                logger.warning(f"Model artifact {path} has mismatched key, ignoring")
+                return None
+            return artifact
+        except Exception as e:
+            logger.warning(f"Failed to load model artifact {path}: {e}")
+            return None
+
+    def save(self, key: str, artifact: Dict[str, Any]) -> Path:
+        """Atomically write an artifact so concurrent workers never read a partial file"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        joblib.dump({**artifact, 'key': key, 'saved_at': datetime.now().isoformat()}, tmp_path)
+        os.replace(tmp_path, path)
+        logger.info(f"💾 Saved model artifact: {path}")
+        return path
+
+
+class LazyModels(Mapping):
+    """Estimator mapping that is only loaded from the artifact store when first accessed"""
+
+    def __init__(self, loader: Callable[[], Dict[str, Any]]):
+        self._loader = loader
+        self._models: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._models is not None
+
+    def _load(self) -> Dict[str, Any]:
+        if self._models is None:
+            with self._lock:
+                if self._models is None:
+                    logger.info("📦 Loading sklearn estimators on demand")
+                    self._models = self._loader()
+        return self._models
+
+    def __getitem__(self, name: str) -> Any:
+        return self._load()[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
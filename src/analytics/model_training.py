@@ -0,0 +1,119 @@
+"""
+Career Model Training - Estimator configurations and concurrent fitting
+The salary, job-match and career-level models share one train/test split and are fitted
+in-process, or concurrently in a process pool for large training sets. Each fit reports wall
+time, CPU time and its held-out score, so configurations can be compared on speed against an
+accuracy bar (see ``benchmarks/model_training.py``).
+"""
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+from sklearn.ensemble import GradientBoostingRegressor, HistGradientBoostingRegressor, RandomForestClassifier
+
+logger = logging.getLogger(__name__)
+
+# 'standard': exact-split gradient boosting; 'hist': histogram-based boosting (much faster on large data)
+MODEL_FLAVORS = ('standard', 'hist')
+
+SCORE_NAMES = {
+    'salary_predictor': 'salary_predictor_r2',
+    'job_matcher': 'job_matcher_accuracy',
+    'career_classifier': 'career_classifier_accuracy'
+}
+
+# Below this many training rows, starting worker processes costs more than the concurrent fits save
+PARALLEL_TRAINING_ROWS = int(os.getenv("CAREER_PARALLEL_TRAINING_ROWS", "100000"))
+
+
+def create_models(flavor: str = 'standard', forest_jobs: int = 1) -> Dict[str, Any]:
+    """Fresh, unfitted estimators for one training run"""
+    if flavor not in MODEL_FLAVORS:
+        raise ValueError(f"Unknown model flavor {flavor!r} (expected one of {MODEL_FLAVORS})")
+    if flavor == 'hist':
+        salary_predictor = HistGradientBoostingRegressor(max_iter=100, random_state=42)
+    else:
+        salary_predictor = GradientBoostingRegressor(n_estimators=100, random_state=42)
+    return {
+        'salary_predictor': salary_predictor,
+        'job_matcher': RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=forest_jobs),
+        'career_classifier': RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=forest_jobs)
+    }
+
+
+def training_workers(rows: int = 0) -> int:
+    """
+    Processes for concurrent fits of ``rows`` training rows; 1 fits in-process.
+    ``CAREER_TRAINING_WORKERS`` fixes the count. Otherwise a pool is only started for training
+    sets of at least ``CAREER_PARALLEL_TRAINING_ROWS`` rows, where it pays for its startup.
+    """
+    configured = os.getenv("CAREER_TRAINING_WORKERS")
+    if configured:
+        return max(1, int(configured))
+    if rows >= PARALLEL_TRAINING_ROWS:
+        return min(3, os.cpu_count() or 1)
+    return 1
+
+
+def fit_estimator(model: Any, X_train: np.ndarray, y_train: np.ndarray,
+                  X_test: np.ndarray, y_test: np.ndarray) -> Tuple[Any, Dict[str, float]]:
+    """Fit and score one estimator, timing wall and CPU (all threads of this process)"""
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    model.fit(X_train, y_train)
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    return model, {
+        'wall_seconds': round(wall, 3),
+        'cpu_seconds': round(cpu, 3),
+        'score': round(float(model.score(X_test, y_test)), 3)
+    }
+
+
+def _process_pool(workers: int) -> ProcessPoolExecutor:
+    # The server process runs threads, so workers come from a fork server rather than a bare fork
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+
+
+def fit_models(models: Dict[str, Any], X: np.ndarray, targets: Dict[str, np.ndarray],
+               train_rows: np.ndarray, test_rows: np.ndarray, workers: int = 1,
+               on_fitted: Optional[Callable[[str, int], None]] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Fit every model on the same split, concurrently when ``workers`` > 1.
+    Returns the fitted models and a report of per-estimator timings and held-out scores.
+    """
+    X_train, X_test = X[train_rows], X[test_rows]
+    fitted, report = {}, {}
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+
+    def record(name: str, model: Any, stats: Dict[str, float]) -> None:
+        fitted[name], report[name] = model, stats
+        if on_fitted is not None:
+            on_fitted(name, len(fitted))
+
+    if workers > 1:
+        with _process_pool(min(workers, len(models))) as pool:
+            futures = {
+                pool.submit(fit_estimator, model, X_train, targets[name][train_rows], X_test, targets[name][test_rows]): name
+                for name, model in models.items()
+            }
+            for future in as_completed(futures):
+                record(futures[future], *future.result())
+    else:
+        for name, model in models.items():
+            record(name, *fit_estimator(model, X_train, targets[name][train_rows], X_test, targets[name][test_rows]))
+
+    cpu = time.process_time() - cpu_start
+    if workers > 1:
+        # Fits ran in worker processes, so their CPU time comes from the per-estimator reports
+        cpu += sum(report[name]['cpu_seconds'] for name in fitted)
+    report['total'] = {
+        'wall_seconds': round(time.perf_counter() - wall_start, 3),
+        'cpu_seconds': round(cpu, 3),
+        'workers': workers
+    }
+    return {name: fitted[name] for name in models}, report
+
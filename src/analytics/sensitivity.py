@@ -0,0 +1,57 @@
+"""
+What-If Sensitivity - Feature sweeps around one career profile
+The full grid of perturbed profiles is built directly as one encoded feature matrix (the base
+row repeated, swept columns overwritten from a mesh), so every point of a sweep is scored by
+a single batched predict call per model.
+"""
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from src.analytics.feature_pipeline import CATEGORICAL_FEATURES, NUMERICAL_FEATURES, CareerFeaturePipeline
+
+# Upper bound on grid points per request, matching the batch endpoint's profile limit
+MAX_GRID_POINTS = 20000
+
+
+def sweep_values(feature: str, spec: Dict[str, Any]) -> List[Any]:
+    """Axis values of one sweep: explicit ``values``, or ``steps`` points from ``start`` to ``stop``"""
+    if feature not in CATEGORICAL_FEATURES and feature not in NUMERICAL_FEATURES:
+        raise ValueError(f"Unknown feature {feature!r}")
+    if spec.get('values'):
+        values = list(spec['values'])
+        return values if feature in CATEGORICAL_FEATURES else [float(v) for v in values]
+    if feature in CATEGORICAL_FEATURES:
+        raise ValueError(f"Categorical feature {feature!r} needs explicit values")
+    if spec.get('start') is None or spec.get('stop') is None:
+        raise ValueError(f"Sweep of {feature!r} needs start and stop, or values")
+    return np.linspace(float(spec['start']), float(spec['stop']), int(spec.get('steps', 11))).tolist()
+
+
+def build_sweep_grid(pipeline: CareerFeaturePipeline, profile: Dict[str, Any],
+                     sweeps: Dict[str, Dict[str, Any]]) -> Tuple[np.ndarray, Dict[str, List[Any]]]:
+    """
+    Scaled feature matrix of every grid point (C order over ``sweeps``) followed by the
+    unperturbed profile as the last row, plus the axis values of each swept feature.
+    """
+    if not sweeps:
+        raise ValueError("At least one feature sweep is required")
+    axes = {feature: sweep_values(feature, spec) for feature, spec in sweeps.items()}
+    shape = [len(values) for values in axes.values()]
+    n_points = int(np.prod(shape))
+    if n_points > MAX_GRID_POINTS:
+        raise ValueError(f"Sweep grid has {n_points} points (maximum {MAX_GRID_POINTS})")
+
+    base = pipeline.encode(profile)
+    matrix = np.repeat(base, n_points + 1, axis=0)
+    mesh = np.meshgrid(*[np.arange(size) for size in shape], indexing='ij')
+    for (feature, values), positions in zip(axes.items(), mesh):
+        if feature in CATEGORICAL_FEATURES:
+            encoded = pipeline.category_codes(feature, np.asarray(values, dtype=object))
+        else:
+            encoded = np.asarray(values, dtype=float)
+        matrix[:n_points, pipeline.feature_names.index(feature)] = encoded[positions.ravel()]
+
+    matrix -= pipeline.mean_
+    matrix /= pipeline.scale_
+    return matrix, axes
@@ -0,0 +1,157 @@
+"""
+Shared Career Data - Memory-mapped market columns and compiled models for multi-worker servers
+The first process that needs an entry builds it under a file lock and writes plain .npy files;
+every other worker attaches read-only with ``np.load(mmap_mode='r')``, so the pages live once
+in the OS page cache instead of being copied into each worker's heap.
+
+Prebuild before starting workers (e.g. as a release step):
+    CAREER_SHARED_MEMORY=1 python -m src.analytics.shared_store
+"""
+import json
+import logging
+import os
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import joblib
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, builders may race but writes stay atomic
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = 'manifest.json'
+OBJECTS = 'objects.joblib'
+
+SharedEntry = Tuple[Dict[str, np.ndarray], Dict[str, Any], Dict[str, Any]]
+
+
+class SharedArrayStore:
+    """Directory of read-only array bundles, one subdirectory per key"""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = Path(root or os.getenv("CAREER_SHARED_DIR", "./models/shared"))
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key
+
+    @contextmanager
+    def _locked(self, key: str):
+        """Exclusive cross-process lock for building ``key``"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / f"{key}.lock", 'w') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def attach(self, key: str) -> Optional[SharedEntry]:
+        """Memory-map a published entry (arrays are read-only), or None if it does not exist"""
+        path = self.path_for(key)
+        manifest_path = path / MANIFEST
+        if not manifest_path.exists():
+            return None
+        manifest = json.loads(manifest_path.read_text())
+        arrays = {name: np.load(path / f"{name}.npy", mmap_mode='r') for name in manifest['arrays']}
+        objects = joblib.load(path / OBJECTS) if (path / OBJECTS).exists() else {}
+        return arrays, manifest['meta'], objects
+
+    def publish(self, key: str, arrays: Dict[str, np.ndarray], meta: Dict[str, Any],
+                objects: Optional[Dict[str, Any]] = None) -> Path:
+        """Write an entry into a temporary directory and rename it into place atomically"""
+        path = self.path_for(key)
+        tmp_path = self.root / f".{key}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        tmp_path.mkdir(parents=True)
+        for name, array in arrays.items():
+            np.save(tmp_path / f"{name}.npy", np.ascontiguousarray(array), allow_pickle=False)
+        if objects:
+            joblib.dump(objects, tmp_path / OBJECTS)
+        # The manifest is written last: its presence marks the entry as complete
+        (tmp_path / MANIFEST).write_text(json.dumps({'arrays': list(arrays), 'meta': meta}))
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp_path, path)
+        logger.info(f"💾 Published shared arrays: {path}")
+        return path
+
+    def build_or_attach(self, key: str, builder: Callable[[], SharedEntry]) -> SharedEntry:
+        """Attach to ``key``; if it is missing, exactly one process runs ``builder`` and publishes it"""
+        entry = self.attach(key)
+        if entry is not None:
+            return entry
+        with self._locked(key):
+            # Another worker may have finished building while we waited for the lock
+            entry = self.attach(key)
+            if entry is not None:
+                return entry
+            logger.info(f"🏗️ Building shared entry {key}")
+            arrays, meta, objects = builder()
+            self.publish(key, arrays, meta, objects)
+        # Re-attach so this process also serves from the shared pages, not its private copy
+        return self.attach(key)
+
+
+def market_to_arrays(df: pd.DataFrame) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """Numeric columns as-is, text columns as categorical codes plus their vocabulary"""
+    arrays, categories = {}, {}
+    for column in df.columns:
+        values = df[column]
+        if pd.api.types.is_numeric_dtype(values):
+            arrays[column] = values.to_numpy()
+        else:
+            categorical = pd.Categorical(values)
+            arrays[column] = categorical.codes
+            categories[column] = [str(v) for v in categorical.categories]
+    return arrays, {'columns': list(df.columns), 'categories': categories}
+
+
+def market_from_arrays(arrays: Dict[str, np.ndarray], meta: Dict[str, Any]) -> pd.DataFrame:
+    """Zero-copy DataFrame over memory-mapped columns (text columns become categoricals)"""
+    columns = {}
+    for column in meta['columns']:
+        if column in meta['categories']:
+            columns[column] = pd.Categorical.from_codes(arrays[column], categories=meta['categories'][column])
+        else:
+            columns[column] = arrays[column]
+    return pd.DataFrame(columns, copy=False)
+
+
+def ensembles_to_arrays(compiled: Dict[str, Any]) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """Flatten several compiled ensembles into one namespaced array dict"""
+    arrays, meta = {}, {}
+    for name, ensemble in compiled.items():
+        ensemble_arrays, meta[name] = ensemble.to_arrays()
+        arrays.update({f"{name}.{field}": array for field, array in ensemble_arrays.items()})
+    return arrays, meta
+
+
+def ensembles_from_arrays(arrays: Dict[str, np.ndarray], meta: Dict[str, Any]) -> Dict[str, Any]:
+    from src.analytics.tree_compiler import CompiledTreeEnsemble
+
+    return {
+        name: CompiledTreeEnsemble.from_arrays(
+            {field: arrays[f"{name}.{field}"] for field in CompiledTreeEnsemble.ARRAY_FIELDS}, ensemble_meta
+        )
+        for name, ensemble_meta in meta.items()
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    os.environ["CAREER_SHARED_MEMORY"] = "1"
+    sys.path.append('.')
+    logging.basicConfig(level=logging.INFO)
+    from src.analytics.career_intelligence_engine import CareerIntelligenceEngine
+
+    engine = CareerIntelligenceEngine()
+    print(f"Shared market data and models ready in {engine.shared_store.root} (bundle {engine.model_key})")
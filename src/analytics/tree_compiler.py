@@ -0,0 +1,171 @@
+"""
+Compiled Tree Ensembles - Flat NumPy node arrays for fast Career Intelligence inference
+Fitted GradientBoostingRegressor and RandomForestClassifier models are flattened into
+feature/threshold/left/right/value arrays and evaluated with a vectorized traversal,
+skipping sklearn's per-call validation and Python overhead.
+"""
+import logging
+from typing import Any, Dict, Tuple
+
+import numpy as np
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestClassifier, RandomForestRegressor
+
+logger = logging.getLogger(__name__)
+
+# Maximum deviation tolerated between compiled and sklearn outputs
+PARITY_TOLERANCE = 1e-6
+
+
+class CompiledTreeEnsemble:
+    """Every tree of an ensemble concatenated into one set of node arrays"""
+
+    ARRAY_FIELDS = ('feature', 'threshold', 'left', 'right', 'value', 'roots')
+
+    def __init__(self, feature: np.ndarray, threshold: np.ndarray, left: np.ndarray, right: np.ndarray,
+                 value: np.ndarray, roots: np.ndarray, max_depth: int, kind: str,
+                 n_features: int, intercept: float = 0.0, scale: float = 1.0, classes: np.ndarray = None):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.max_depth = max_depth
+        self.kind = kind  # 'boosted_regressor', 'forest_regressor' or 'forest_classifier'
+        self.n_features = n_features
+        self.intercept = intercept
+        self.scale = scale
+        self.classes_ = classes
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @classmethod
+    def from_sklearn(cls, estimator: Any) -> 'CompiledTreeEnsemble':
+        """Flatten a fitted sklearn tree ensemble; raises ValueError if it is not supported"""
+        if isinstance(estimator, GradientBoostingRegressor):
+            if estimator.init_ != 'zero' and type(estimator.init_).__name__ != 'DummyRegressor':
+                raise ValueError("Only constant init estimators can be compiled")
+            trees = [stage[0] for stage in estimator.estimators_]
+            probe = np.zeros((1, estimator.n_features_in_), dtype=np.float32)
+            intercept = float(estimator._raw_predict_init(probe)[0, 0])
+            kind, scale, classes = 'boosted_regressor', float(estimator.learning_rate), None
+        elif isinstance(estimator, RandomForestClassifier):
+            if estimator.n_outputs_ != 1:
+                raise ValueError("Multi-output forests are not supported")
+            trees = list(estimator.estimators_)
+            intercept, kind, scale, classes = 0.0, 'forest_classifier', 1.0, estimator.classes_
+        elif isinstance(estimator, RandomForestRegressor):
+            if estimator.n_outputs_ != 1:
+                raise ValueError("Multi-output forests are not supported")
+            trees = list(estimator.estimators_)
+            intercept, kind, scale, classes = 0.0, 'forest_regressor', 1.0, None
+        else:
+            raise ValueError(f"Cannot compile estimator of type {type(estimator).__name__}")
+
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        for tree in trees:
+            t = tree.tree_
+            is_leaf = t.children_left == -1
+            node_ids = np.arange(t.node_count) + offset
+
+            # Leaves point back at themselves and always "go left", so a fixed number
+            # of traversal steps lands every row on its leaf without branching
+            features.append(np.where(is_leaf, 0, t.feature).astype(np.intp))
+            thresholds.append(np.where(is_leaf, np.inf, t.threshold))
+            lefts.append(np.where(is_leaf, node_ids, t.children_left + offset).astype(np.intp))
+            rights.append(np.where(is_leaf, node_ids, t.children_right + offset).astype(np.intp))
+
+            value = t.value[:, 0, :].astype(float)
+            if kind == 'forest_classifier':
+                value = value / value.sum(axis=1, keepdims=True)
+            values.append(value)
+            roots.append(offset)
+            offset += t.node_count
+
+        return cls(
+            feature=np.concatenate(features),
+            threshold=np.concatenate(thresholds),
+            left=np.concatenate(lefts),
+            right=np.concatenate(rights),
+            value=np.ascontiguousarray(np.concatenate(values)),
+            roots=np.asarray(roots, dtype=np.intp),
+            max_depth=max(tree.tree_.max_depth for tree in trees),
+            kind=kind,
+            n_features=estimator.n_features_in_,
+            intercept=intercept,
+            scale=scale,
+            classes=classes
+        )
+
+    def to_arrays(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """Node arrays plus JSON-serializable scalars, e.g. for memory-mapped sharing"""
+        arrays = {name: getattr(self, name) for name in self.ARRAY_FIELDS}
+        meta = {
+            'max_depth': int(self.max_depth),
+            'kind': self.kind,
+            'n_features': int(self.n_features),
+            'intercept': float(self.intercept),
+            'scale': float(self.scale),
+            'classes': self.classes_.tolist() if self.classes_ is not None else None
+        }
+        return arrays, meta
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], meta: Dict[str, Any]) -> 'CompiledTreeEnsemble':
+        """Rebuild from ``to_arrays`` output without copying the (possibly memory-mapped) arrays"""
+        classes = np.asarray(meta['classes']) if meta.get('classes') is not None else None
+        return cls(**{name: arrays[name] for name in cls.ARRAY_FIELDS},
+                   max_depth=meta['max_depth'], kind=meta['kind'], n_features=meta['n_features'],
+                   intercept=meta['intercept'], scale=meta['scale'], classes=classes)
+
+    def apply(self, X: np.ndarray) -> np.ndarray:
+        """Leaf node index of every row in every tree, shape (n_rows, n_trees)"""
+        # sklearn compares float32 inputs against float64 thresholds; do the same for identical splits
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (X.shape[0], self.n_trees)).copy()
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return nodes
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        leaves = self.apply(X)
+        if self.kind == 'forest_classifier':
+            return self.classes_[np.argmax(self.value[leaves].mean(axis=1), axis=1)]
+        leaf_values = self.value[leaves, 0]
+        if self.kind == 'boosted_regressor':
+            return self.intercept + self.scale * leaf_values.sum(axis=1)
+        return leaf_values.mean(axis=1)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        if self.kind != 'forest_classifier':
+            raise ValueError("predict_proba is only available for classifiers")
+        return self.value[self.apply(X)].mean(axis=1)
+
+    def parity_error(self, estimator: Any, X: np.ndarray) -> float:
+        """Largest deviation from the sklearn estimator on ``X`` (relative for large regression outputs)"""
+        if self.kind == 'forest_classifier':
+            return float(np.max(np.abs(self.predict_proba(X) - estimator.predict_proba(X))))
+        expected = estimator.predict(X)
+        return float(np.max(np.abs(self.predict(X) - expected) / np.maximum(1.0, np.abs(expected))))
+
+
+def compile_models(models: Dict[str, Any], X_check: np.ndarray) -> Dict[str, CompiledTreeEnsemble]:
+    """Compile every supported model that matches sklearn on ``X_check``; others stay on sklearn"""
+    compiled = {}
+    for name, model in models.items():
+        try:
+            ensemble = CompiledTreeEnsemble.from_sklearn(model)
+            error = ensemble.parity_error(model, X_check)
+            if error > PARITY_TOLERANCE:
+                logger.warning(f"Compiled {name} deviates from sklearn by {error:.2e}, keeping sklearn")
+                continue
+            compiled[name] = ensemble
+        except ValueError as e:
+            logger.info(f"Not compiling {name}: {e}")
+    return compiled
+
@@ -0,0 +1,67 @@
+"""
+Upskilling Planner - Model-guided search over skill improvement plans
+A plan is a sequence of +1 skill-point steps, each costing ``MONTHS_PER_SKILL_POINT`` months.
+Beam search expands every kept plan by one step per skill, merges plans that reach the same
+skill levels, and scores the whole frontier with one batched model call per step.
+"""
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+# The engine's rule of thumb for closing skill gaps
+MONTHS_PER_SKILL_POINT = 2
+MAX_SKILL_LEVEL = 10.0
+
+# Skills a plan can improve, with their display names
+UPSKILL_SKILLS = {
+    'python_skill': 'Python Programming',
+    'sql_skill': 'SQL & Databases',
+    'ml_skill': 'Machine Learning',
+    'communication_skill': 'Communication'
+}
+
+
+def beam_search_plan(score_states: Callable[[np.ndarray], np.ndarray], start: np.ndarray, max_steps: int,
+                     beam_width: int = 16, patience: int = 6) -> Tuple[List[int], Dict[str, int]]:
+    """
+    Best sequence of skill indices to improve, starting from ``start`` skill levels.
+    ``score_states`` maps an (n, n_skills) array of levels to n objective values.
+    Search stops early once ``patience`` consecutive steps fail to beat the best plan.
+    """
+    n_skills = len(start)
+    states = start[None, :].astype(float)
+    paths: List[List[int]] = [[]]
+    best_score = float(score_states(states)[0])
+    best_path: List[int] = []
+    scored, stale = 1, 0
+
+    for _ in range(max_steps):
+        # Every kept plan extended by one point in every skill that is not maxed out
+        candidates = np.repeat(states, n_skills, axis=0)
+        skill_of = np.tile(np.arange(n_skills), len(states))
+        parent_of = np.repeat(np.arange(len(states)), n_skills)
+        rows = np.arange(len(candidates))
+        open_rows = candidates[rows, skill_of] < MAX_SKILL_LEVEL
+        candidates[rows, skill_of] = np.minimum(candidates[rows, skill_of] + 1, MAX_SKILL_LEVEL)
+        candidates, skill_of, parent_of = candidates[open_rows], skill_of[open_rows], parent_of[open_rows]
+        if not len(candidates):
+            break
+
+        # Plans reaching the same levels are interchangeable; keep the first of each
+        candidates, first = np.unique(candidates, axis=0, return_index=True)
+        skill_of, parent_of = skill_of[first], parent_of[first]
+
+        scores = score_states(candidates)
+        scored += len(candidates)
+        keep = np.argsort(-scores, kind='stable')[:beam_width]
+        states = candidates[keep]
+        paths = [paths[parent_of[i]] + [int(skill_of[i])] for i in keep]
+
+        if scores[keep[0]] > best_score:
+            best_score, best_path, stale = float(scores[keep[0]]), paths[0], 0
+        else:
+            stale += 1
+            if stale >= patience:
+                break
+
+    return best_path, {'candidates_scored': scored, 'steps_searched': len(paths[0]) if paths else 0}
@@ -10,6 +10,8 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any
 import json
 
+from src.utils.lazy import lazy_module_attributes, lazy_singleton
+
 class VisualizationEngine:
     def __init__(self):
         self.color_palette = [
@@ -414,5 +416,6 @@ class VisualizationEngine:
         """Create an error chart"""
         return self._create_empty_chart(f"⚠️ {error_message}")
 
-# Global visualization engine
-viz_engine = VisualizationEngine()
+# Global instance, built on first use so importing this module stays cheap
+get_viz_engine = lazy_singleton(VisualizationEngine)
+__getattr__ = lazy_module_attributes(__name__, viz_engine=get_viz_engine)  # Backwards compatible `from ... import viz_engine`
@@ -0,0 +1,146 @@
+"""
+Workflow Analytics Queries - Dashboard summaries computed inside MongoDB
+Daily counts, hourly/weekday patterns, priority and industry success scores are expressed as
+aggregation pipelines ($match -> $project -> $facet/$group), so only the grouped rows travel
+over the wire and dashboard latency and memory stay flat as the workflows collection grows.
+"""
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Same weights as DataScienceEngine._calculate_success_score
+STATUS_SCORES = {'completed': 100, 'in_progress': 50, 'failed': 0, 'cancelled': 25}
+DEFAULT_STATUS_SCORE = 50
+EXECUTION_TIME_PENALTY = 30
+FEEDBACK_WEIGHT = 5
+SUCCESS_THRESHOLD = 75
+
+
+def match_window(start: datetime, end: datetime) -> Dict[str, Any]:
+    return {'$match': {'created_at': {'$gte': start, '$lte': end}}}
+
+
+def execution_time_p95_pipeline(start: datetime, end: datetime) -> List[Dict[str, Any]]:
+    """95th percentile of execution_time ($percentile needs MongoDB 7.0+)"""
+    return [
+        match_window(start, end),
+        {'$match': {'execution_time': {'$type': 'number'}}},
+        {'$group': {
+            '_id': None,
+            'p95': {'$percentile': {'input': '$execution_time', 'p': [0.95], 'method': 'approximate'}}
+        }}
+    ]
+
+
+def success_score_expression(p95_execution_time: Optional[float]) -> Dict[str, Any]:
+    """Per-document success score: status base, minus execution-time penalty, plus feedback bonus, in [0, 100]"""
+    status_score = {'$switch': {
+        'branches': [{'case': {'$eq': ['$status', status]}, 'then': score} for status, score in STATUS_SCORES.items()],
+        'default': DEFAULT_STATUS_SCORE
+    }}
+    penalty: Any = 0
+    if p95_execution_time:
+        penalty = {'$cond': [
+            {'$isNumber': '$execution_time'},
+            {'$min': [EXECUTION_TIME_PENALTY, {'$max': [0, {
+                '$multiply': [{'$divide': ['$execution_time', p95_execution_time]}, EXECUTION_TIME_PENALTY]
+            }]}]},
+            0
+        ]}
+    feedback_bonus = {'$multiply': [{'$ifNull': ['$user_feedback.rating', 0]}, FEEDBACK_WEIGHT]}
+    score = {'$add': [{'$subtract': [status_score, penalty]}, feedback_bonus]}
+    return {'$min': [100, {'$max': [0, score]}]}
+
+
+def _count_by(key: Any) -> List[Dict[str, Any]]:
+    return [{'$group': {'_id': key, 'count': {'$sum': 1}}}, {'$sort': {'_id': 1}}]
+
+
+def dashboard_summary_pipeline(start: datetime, end: datetime,
+                               p95_execution_time: Optional[float]) -> List[Dict[str, Any]]:
+    """One round trip for every dashboard summary; each facet returns at most a few hundred rows"""
+    return [
+        match_window(start, end),
+        {'$project': {
+            '_id': 0,
+            'created_at': 1,
+            'status': 1,
+            'execution_time': 1,
+            'priority': {'$ifNull': ['$priority', 'unknown']},
+            'industry': {'$ifNull': ['$industry', 'unknown']},
+            'total_tokens': {'$ifNull': ['$token_usage.total_tokens', 0]},
+            'success_score': success_score_expression(p95_execution_time)
+        }},
+        {'$facet': {
+            'summary': [{'$group': {
+                '_id': None,
+                'total': {'$sum': 1},
+                'avg_success_score': {'$avg': '$success_score'},
+                'completed': {'$sum': {'$cond': [{'$eq': ['$status', 'completed']}, 1, 0]}},
+                'successful': {'$sum': {'$cond': [{'$gt': ['$success_score', SUCCESS_THRESHOLD]}, 1, 0]}},
+                'avg_execution_time': {'$avg': '$execution_time'},
+                'avg_tokens': {'$avg': '$total_tokens'}
+            }}],
+            'daily': _count_by({'$dateToString': {'format': '%Y-%m-%d', 'date': '$created_at'}}),
+            'hourly': _count_by({'$hour': '$created_at'}),
+            # Monday = 0, as pandas' dayofweek
+            'weekday': _count_by({'$subtract': [{'$isoDayOfWeek': '$created_at'}, 1]}),
+            'priority': [
+                {'$group': {'_id': '$priority', 'count': {'$sum': 1}, 'avg_success_score': {'$avg': '$success_score'}}},
+                {'$sort': {'_id': 1}}
+            ],
+            'industry': [
+                {'$group': {
+                    '_id': '$industry',
+                    'mean': {'$avg': '$success_score'},
+                    'count': {'$sum': 1},
+                    'std': {'$stdDevSamp': '$success_score'}
+                }},
+                {'$sort': {'_id': 1}}
+            ]
+        }}
+    ]
+
+
+async def execution_time_p95(collection, start: datetime, end: datetime) -> Optional[float]:
+    """p95 via $percentile, or via a sorted index-friendly skip on servers older than 7.0"""
+    try:
+        rows = await collection.aggregate(execution_time_p95_pipeline(start, end)).to_list(length=1)
+        return float(rows[0]['p95'][0]) if rows and rows[0]['p95'] else None
+    except Exception as e:
+        logger.info(f"$percentile unavailable ({e}), falling back to a sorted lookup")
+    query = {'created_at': {'$gte': start, '$lte': end}, 'execution_time': {'$type': 'number'}}
+    n = await collection.count_documents(query)
+    if not n:
+        return None
+    cursor = collection.find(query, {'execution_time': 1, '_id': 0}).sort('execution_time', 1).skip(int(0.95 * (n - 1))).limit(1)
+    rows = await cursor.to_list(length=1)
+    return float(rows[0]['execution_time']) if rows else None
+
+
+def mode_key(rows: List[Dict[str, Any]]) -> Any:
+    """Most frequent key; ties go to the smallest, as pandas' mode().iloc[0]"""
+    return min(rows, key=lambda row: (-row['count'], row['_id']))['_id'] if rows else 0
+
+
+async def fetch_workflow_summary(collection, start: datetime, end: datetime) -> Dict[str, Any]:
+    """Aggregated workflow statistics for ``start``..``end``, computed server-side"""
+    p95 = await execution_time_p95(collection, start, end)
+    facets = (await collection.aggregate(dashboard_summary_pipeline(start, end, p95), allowDiskUse=True).to_list(length=1))[0]
+    summary = facets['summary'][0] if facets['summary'] else {
+        'total': 0, 'avg_success_score': None, 'completed': 0, 'successful': 0,
+        'avg_execution_time': None, 'avg_tokens': None
+    }
+    summary.pop('_id', None)
+    return {
+        **summary,
+        'p95_execution_time': p95,
+        'daily_counts': [{'date': date.fromisoformat(row['_id']), 'count': row['count']} for row in facets['daily']],
+        'hourly_counts': [{'hour': row['_id'], 'count': row['count']} for row in facets['hourly']],
+        'peak_hour': mode_key(facets['hourly']),
+        'busiest_day': mode_key(facets['weekday']),
+        'priority': facets['priority'],
+        'industry': facets['industry']
+    }
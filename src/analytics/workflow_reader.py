@@ -0,0 +1,105 @@
+"""
+Workflow Reader - Projected, streaming ingestion of workflow documents
+Only the fields the analytics actually use are fetched (never the large ``result`` /
+``description`` blobs), the cursor is drained in batches, and each batch is written straight
+into preallocated column arrays, so peak memory is one batch of documents plus the columns.
+"""
+import logging
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Fields read by _preprocess_workflow_data, predict_workflow_success and cluster_workflow_patterns
+WORKFLOW_PROJECTION = {
+    '_id': 0,
+    'created_at': 1,
+    'status': 1,
+    'priority': 1,
+    'industry': 1,
+    'execution_time': 1,
+    'token_usage.total_tokens': 1,
+    'token_usage.completion_tokens': 1,
+    'user_feedback.rating': 1
+}
+
+DEFAULT_BATCH_SIZE = 5000
+
+# column -> (dtype, fill value, extractor)
+_COLUMNS = {
+    'created_at': ('datetime64[us]', np.datetime64('NaT'), lambda doc: doc.get('created_at')),
+    'status': (object, None, lambda doc: doc.get('status')),
+    'priority': (object, None, lambda doc: doc.get('priority')),
+    'industry': (object, None, lambda doc: doc.get('industry')),
+    'execution_time': (np.float64, np.nan, lambda doc: doc.get('execution_time')),
+    'total_tokens': (np.float64, 0.0, lambda doc: _nested(doc, 'token_usage', 'total_tokens')),
+    'completion_tokens': (np.float64, 0.0, lambda doc: _nested(doc, 'token_usage', 'completion_tokens')),
+    'feedback_rating': (np.float64, 0.0, lambda doc: _nested(doc, 'user_feedback', 'rating'))
+}
+
+# Flattened columns exist only if some document carries their parent field, as with pd.DataFrame(documents)
+_SOURCE_FIELD = {'total_tokens': 'token_usage', 'completion_tokens': 'token_usage', 'feedback_rating': 'user_feedback'}
+
+
+def _nested(doc: Dict[str, Any], field: str, key: str) -> Any:
+    value = doc.get(field)
+    return value.get(key) if isinstance(value, dict) else None
+
+
+def _coerce(value: Any, dtype: Any, fill: Any) -> Any:
+    """``value`` as ``dtype``, or ``fill`` if a malformed document stored something unconvertible"""
+    try:
+        converted = np.array(value, dtype=dtype)
+    except (TypeError, ValueError, OverflowError):
+        return fill
+    return converted[()] if converted.ndim == 0 else fill
+
+
+def _allocate(capacity: int) -> Dict[str, np.ndarray]:
+    return {name: np.full(capacity, fill, dtype=dtype) for name, (dtype, fill, _) in _COLUMNS.items()}
+
+
+def _grow(columns: Dict[str, np.ndarray], capacity: int) -> Dict[str, np.ndarray]:
+    grown = _allocate(capacity)
+    for name, values in columns.items():
+        grown[name][:len(values)] = values
+    return grown
+
+
+async def read_workflow_frame(cursor, expected: int = 0, batch_size: int = DEFAULT_BATCH_SIZE) -> pd.DataFrame:
+    """
+    Drain ``cursor`` (already projected with WORKFLOW_PROJECTION) into a DataFrame.
+    ``expected`` sizes the arrays up front; they double if more documents arrive.
+    """
+    columns = _allocate(max(expected, batch_size))
+    seen = set()
+    n = 0
+    while True:
+        batch = await cursor.to_list(length=batch_size)
+        if not batch:
+            break
+        end = n + len(batch)
+        if end > len(columns['created_at']):
+            columns = _grow(columns, max(end, 2 * len(columns['created_at'])))
+        for name, (dtype, fill, extract) in _COLUMNS.items():
+            values = [extract(doc) for doc in batch]
+            present = [value is not None for value in values]
+            if any(present):
+                seen.add(name)
+                if not all(present):
+                    values = [fill if value is None else value for value in values]
+                try:
+                    columns[name][n:end] = values
+                except (TypeError, ValueError, OverflowError):
+                    # One bad value (e.g. execution_time "30s") must not lose the batch: convert one by one
+                    columns[name][n:end] = [_coerce(value, dtype, fill) for value in values]
+        seen.update(field for field in _SOURCE_FIELD.values() if any(field in doc for doc in batch))
+        n = end
+
+    if not n:
+        return pd.DataFrame()
+    kept = [name for name in _COLUMNS if name in seen or _SOURCE_FIELD.get(name) in seen]
+    return pd.DataFrame({name: columns[name][:n] for name in kept})
+
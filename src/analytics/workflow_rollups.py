@@ -0,0 +1,305 @@
+"""
+Workflow Rollups - Incrementally maintained hourly and daily analytics summaries
+Every stored workflow bumps one hourly and one daily rollup document with ``$inc`` upserts,
+so dashboards read a few hundred small documents instead of rescanning 30 days of workflows.
+
+Hourly rollups carry counts, status and priority breakdowns and execution-time / token sums
+(and sums of squares). Daily rollups add industry breakdowns and success-score cells: counts
+keyed by status, feedback rating and a log-scaled execution-time bucket, from which the
+success score (whose time penalty is relative to the window's p95) is rebuilt at read time.
+"""
+import logging
+import math
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import UpdateOne
+
+from src.analytics.analytics_cache import STATE_COLLECTION, bump_data_version
+from src.analytics.workflow_queries import (
+    DEFAULT_STATUS_SCORE, EXECUTION_TIME_PENALTY, FEEDBACK_WEIGHT, STATUS_SCORES, SUCCESS_THRESHOLD, mode_key
+)
+
+logger = logging.getLogger(__name__)
+
+HOURLY_COLLECTION = "workflow_rollups_hourly"
+DAILY_COLLECTION = "workflow_rollups_daily"
+ROLLUP_STATE_ID = "workflow_rollups"
+
+# Execution-time buckets are quarter octaves (~19% wide), so rebuilt time penalties are within a few percent
+BUCKETS_PER_OCTAVE = 4
+
+# Fields of a raw workflow that feed the rollups
+ROLLUP_PROJECTION = {
+    "_id": 0, "created_at": 1, "stored_at": 1, "status": 1, "priority": 1, "industry": 1,
+    "execution_time": 1, "token_usage.total_tokens": 1, "user_feedback.rating": 1
+}
+
+
+def _key(value: Any) -> str:
+    """Field-name-safe form of a category value ('.' and '$' are not allowed in keys)"""
+    if value is None or value == "":
+        return "unknown"
+    return str(value).replace(".", "_").replace("$", "_")
+
+
+def _number(value: Any) -> Optional[float]:
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value) else None
+
+
+def execution_bucket(execution_time: Any) -> str:
+    """'none' (no time recorded), 'zero', or the index of the quarter octave holding the time"""
+    seconds = _number(execution_time)
+    if seconds is None:
+        return "none"
+    if seconds <= 0:
+        return "zero"
+    return str(math.floor(math.log2(seconds) * BUCKETS_PER_OCTAVE))
+
+
+def bucket_value(bucket: str) -> Optional[float]:
+    """Representative (geometric mid-point) execution time of a bucket"""
+    if bucket == "none":
+        return None
+    if bucket == "zero":
+        return 0.0
+    return 2 ** ((int(bucket) + 0.5) / BUCKETS_PER_OCTAVE)
+
+
+def workflow_created_at(workflow: Dict[str, Any]) -> datetime:
+    """created_at as a datetime (ISO strings are parsed), falling back to stored_at"""
+    created_at = workflow.get("created_at")
+    if isinstance(created_at, str):
+        try:
+            created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00")).replace(tzinfo=None)
+        except ValueError:
+            created_at = None
+    if isinstance(created_at, datetime):
+        return created_at
+    return workflow.get("stored_at") or datetime.now()
+
+
+def rollup_updates(workflow: Dict[str, Any]) -> List[Tuple[str, str, datetime, Dict[str, float]]]:
+    """(collection, rollup id, period start, $inc document) for the hourly and daily rollups of one workflow"""
+    created_at = workflow_created_at(workflow)
+    status = _key(workflow.get("status"))
+    priority = _key(workflow.get("priority"))
+    industry = _key(workflow.get("industry"))
+    execution_time = _number(workflow.get("execution_time"))
+    token_usage = workflow.get("token_usage")
+    tokens = _number(token_usage.get("total_tokens")) if isinstance(token_usage, dict) else None
+    feedback = workflow.get("user_feedback")
+    rating = (_number(feedback.get("rating")) if isinstance(feedback, dict) else None) or 0.0
+    cell = f"{status}|{round(rating * 10)}|{execution_bucket(execution_time)}"
+
+    inc: Dict[str, float] = {
+        "count": 1,
+        f"status.{status}": 1,
+        f"priority.{priority}": 1,
+        "tokens.sum": tokens or 0.0,
+        "tokens.sumsq": (tokens or 0.0) ** 2
+    }
+    if execution_time is not None:
+        inc.update({
+            "execution_time.count": 1,
+            "execution_time.sum": execution_time,
+            "execution_time.sumsq": execution_time ** 2
+        })
+    daily_inc = {
+        **inc,
+        f"industry.{industry}": 1,
+        f"cells.all.{cell}": 1,
+        f"cells.priority.{priority}.{cell}": 1,
+        f"cells.industry.{industry}.{cell}": 1
+    }
+
+    hour = created_at.replace(minute=0, second=0, microsecond=0)
+    day = hour.replace(hour=0)
+    return [
+        (HOURLY_COLLECTION, hour.strftime("%Y-%m-%dT%H"), hour, inc),
+        (DAILY_COLLECTION, day.strftime("%Y-%m-%d"), day, daily_inc)
+    ]
+
+
+def _upsert(rollup_id: str, start: datetime, inc: Dict[str, float]) -> UpdateOne:
+    """The one rollup write, shared by live recording and the backfill so their documents cannot drift"""
+    return UpdateOne({"_id": rollup_id}, {"$inc": inc, "$setOnInsert": {"start": start}}, upsert=True)
+
+
+async def record_workflow(db, workflow: Dict[str, Any]):
+    """Fold one newly stored workflow into its hourly and daily rollups"""
+    for collection, rollup_id, start, inc in rollup_updates(workflow):
+        await db[collection].bulk_write([_upsert(rollup_id, start, inc)])
+
+
+async def rollups_ready(db) -> bool:
+    """Rollups are read only once a backfill has covered the workflows stored before them"""
+    return await db[STATE_COLLECTION].find_one({"_id": ROLLUP_STATE_ID}) is not None
+
+
+async def backfill_rollups(db, batch_size: int = 5000) -> Dict[str, int]:
+    """Rebuild both rollup collections from the raw workflows (run while workflow writes are paused)"""
+    pending: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    workflows = 0
+    cursor = db.workflows.find({}, ROLLUP_PROJECTION, batch_size=batch_size)
+    while True:
+        batch = await cursor.to_list(length=batch_size)
+        if not batch:
+            break
+        for workflow in batch:
+            for collection, rollup_id, start, inc in rollup_updates(workflow):
+                rollup = pending.setdefault((collection, rollup_id), {"start": start, "inc": defaultdict(float)})
+                for field, amount in inc.items():
+                    rollup["inc"][field] += amount
+        workflows += len(batch)
+
+    counts = {}
+    for collection in (HOURLY_COLLECTION, DAILY_COLLECTION):
+        await db[collection].delete_many({})
+        requests = [_upsert(rollup_id, rollup["start"], dict(rollup["inc"]))
+                    for (name, rollup_id), rollup in pending.items() if name == collection]
+        for start in range(0, len(requests), 1000):
+            await db[collection].bulk_write(requests[start:start + 1000], ordered=False)
+        counts[collection] = len(requests)
+
+    await db[STATE_COLLECTION].update_one(
+        {"_id": ROLLUP_STATE_ID},
+        {"$set": {"backfilled_at": datetime.now(), "workflows": workflows}},
+        upsert=True
+    )
+    # Summaries now come from the rollups; results cached from the raw pipeline are stale
+    await bump_data_version(db)
+    logger.info(f"✅ Rolled up {workflows} workflows into {counts[HOURLY_COLLECTION]} hourly "
+                f"and {counts[DAILY_COLLECTION]} daily documents")
+    return {"workflows": workflows, **counts}
+
+
+def _cell_scores(cells: Dict[str, float], p95_execution_time: Optional[float]) -> List[Tuple[float, float]]:
+    """(success score, count) per cell, with the same weights as the raw success score"""
+    scored = []
+    for cell, count in cells.items():
+        status, rating, bucket = cell.rsplit("|", 2)
+        penalty = 0.0
+        seconds = bucket_value(bucket)
+        if p95_execution_time and seconds is not None:
+            penalty = min(EXECUTION_TIME_PENALTY, max(0.0, seconds / p95_execution_time * EXECUTION_TIME_PENALTY))
+        score = STATUS_SCORES.get(status, DEFAULT_STATUS_SCORE) - penalty + int(rating) / 10 * FEEDBACK_WEIGHT
+        scored.append((min(100.0, max(0.0, score)), count))
+    return scored
+
+
+def _score_stats(scored: List[Tuple[float, float]]) -> Dict[str, Any]:
+    count = sum(n for _, n in scored)
+    mean = sum(score * n for score, n in scored) / count if count else None
+    std = None
+    if count > 1:
+        std = math.sqrt(sum(n * (score - mean) ** 2 for score, n in scored) / (count - 1))
+    return {"count": int(count), "mean": mean, "std": std}
+
+
+def _p95(cells: Dict[str, float]) -> Optional[float]:
+    """95th percentile of execution time from the bucket histogram"""
+    histogram: Dict[str, float] = defaultdict(float)
+    for cell, count in cells.items():
+        bucket = cell.rsplit("|", 1)[1]
+        if bucket != "none":
+            histogram[bucket] += count
+    total = sum(histogram.values())
+    if not total:
+        return None
+    rank = 0.95 * (total - 1)
+    seen = 0.0
+    for bucket in sorted(histogram, key=lambda b: -math.inf if b == "zero" else int(b)):
+        if seen + histogram[bucket] > rank:
+            if bucket == "zero":
+                return 0.0
+            # Interpolate the rank's position inside the bucket on the log scale
+            fraction = (rank - seen + 0.5) / histogram[bucket]
+            return 2 ** ((int(bucket) + fraction) / BUCKETS_PER_OCTAVE)
+        seen += histogram[bucket]
+    return None
+
+
+def _merge(target: Dict[str, Any], source: Dict[str, Any]):
+    for field, value in source.items():
+        if isinstance(value, dict):
+            _merge(target.setdefault(field, {}), value)
+        else:
+            target[field] = target.get(field, 0) + value
+
+
+async def fetch_rollup_summary(db, start: datetime, end: datetime) -> Dict[str, Any]:
+    """
+    Same fields as workflow_queries.fetch_workflow_summary, read from rollups: counts from the
+    hourly documents overlapping ``start``..``end``, success statistics from the daily ones.
+    """
+    hour_start = start.replace(minute=0, second=0, microsecond=0)
+    hours = await db[HOURLY_COLLECTION].find({"start": {"$gte": hour_start, "$lte": end}}).to_list(length=None)
+    days = await db[DAILY_COLLECTION].find(
+        {"start": {"$gte": hour_start.replace(hour=0), "$lte": end}}, {"cells": 1}
+    ).to_list(length=None)
+
+    totals: Dict[str, Any] = {}
+    daily: Dict[date, int] = defaultdict(int)
+    hourly: Dict[int, int] = defaultdict(int)
+    weekday: Dict[int, int] = defaultdict(int)
+    for rollup in hours:
+        _merge(totals, {field: rollup.get(field, {}) for field in ("status", "priority", "execution_time", "tokens")})
+        totals["count"] = totals.get("count", 0) + rollup["count"]
+        daily[rollup["start"].date()] += rollup["count"]
+        hourly[rollup["start"].hour] += rollup["count"]
+        weekday[rollup["start"].weekday()] += rollup["count"]
+
+    cells: Dict[str, Any] = {}
+    for rollup in days:
+        _merge(cells, rollup.get("cells", {}))
+
+    p95 = _p95(cells.get("all", {}))
+    overall = _cell_scores(cells.get("all", {}), p95)
+    total = int(totals.get("count", 0))
+    execution_time = totals.get("execution_time", {})
+    hourly_rows = [{"_id": hour, "count": count} for hour, count in sorted(hourly.items())]
+
+    return {
+        "total": total,
+        "avg_success_score": _score_stats(overall)["mean"],
+        "completed": int(totals.get("status", {}).get("completed", 0)),
+        "successful": int(sum(n for score, n in overall if score > SUCCESS_THRESHOLD)),
+        "avg_execution_time": execution_time["sum"] / execution_time["count"] if execution_time.get("count") else None,
+        "avg_tokens": totals["tokens"]["sum"] / total if total else None,
+        "p95_execution_time": p95,
+        "daily_counts": [{"date": day, "count": count} for day, count in sorted(daily.items())],
+        "hourly_counts": [{"hour": row["_id"], "count": row["count"]} for row in hourly_rows],
+        "peak_hour": mode_key(hourly_rows),
+        "busiest_day": mode_key([{"_id": day, "count": count} for day, count in weekday.items()]),
+        "priority": [
+            {"_id": priority, "count": stats["count"], "avg_success_score": stats["mean"]}
+            for priority, stats in sorted(
+                (priority, _score_stats(_cell_scores(priority_cells, p95)))
+                for priority, priority_cells in cells.get("priority", {}).items()
+            )
+        ],
+        "industry": [
+            {"_id": industry, **_score_stats(_cell_scores(industry_cells, p95))}
+            for industry, industry_cells in sorted(cells.get("industry", {}).items())
+        ]
+    }
+
+
+if __name__ == "__main__":
+    import asyncio
+    import sys
+
+    from database.mongodb_config import db_manager
+
+    async def main():
+        if not await db_manager.connect():
+            sys.exit(1)
+        try:
+            print(await backfill_rollups(db_manager.db))
+        finally:
+            await db_manager.disconnect()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
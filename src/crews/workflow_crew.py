@@ -6,6 +6,7 @@ from crewai import Crew, Process, Task
 from src.agents.workflow_agent import WorkflowAgent
 from src.agents.analysis_agent import AnalysisAgent
 from src.agents.execution_agent import ExecutionAgent
+from src.utils.lazy import lazy_module_attributes, lazy_singleton
 import logging
 
 logger = logging.getLogger(__name__)
@@ -176,3 +177,7 @@ Focus on practical, measurable improvements.""",
         """Callback function for monitoring crew execution steps"""
         logger.info(f"Crew step completed: {step_output}")
         # Here you could add custom monitoring, logging, or notification logic
+
+# Global crew, built on first use so importing this module does not construct agents
+get_workflow_crew = lazy_singleton(WorkflowCrew)
+__getattr__ = lazy_module_attributes(__name__, workflow_crew=get_workflow_crew)  # Backwards compatible `from ... import workflow_crew`
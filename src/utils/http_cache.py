@@ -0,0 +1,69 @@
+"""
+HTTP caching helpers for SkillForge AI
+Content-derived ETags (checked before any rendering work, so unchanged views cost a 304)
+and gzip/brotli response encoding negotiated from Accept-Encoding.
+"""
+
+import gzip
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+# Smaller bodies are not worth the compression overhead
+MIN_COMPRESS_BYTES = 1024
+
+
+def etag_for(data: Any) -> str:
+    """Weak ETag over the JSON form of ``data``"""
+    payload = json.dumps(data, sort_keys=True, default=str)
+    return f'W/"{hashlib.sha256(payload.encode()).hexdigest()[:32]}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """True if the client's If-None-Match already names ``etag``"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip() for tag in header.split(",")}
+    return "*" in candidates or etag in candidates or etag.removeprefix("W/") in candidates
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+
+
+def choose_encoding(request: Request) -> Optional[str]:
+    """'br', 'gzip' or None, from the client's Accept-Encoding"""
+    accepted = {
+        part.split(";")[0].strip().lower()
+        for part in request.headers.get("accept-encoding", "").split(",")
+        if not part.strip().endswith(";q=0")
+    }
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def encoded_response(request: Request, body: bytes, media_type: str, etag: Optional[str] = None,
+                     status_code: int = 200) -> Response:
+    """Response with ``body`` compressed as the client accepts, tagged with ``etag``"""
+    headers: Dict[str, str] = {"Vary": "Accept-Encoding", "Cache-Control": "private, no-cache"}
+    if etag:
+        headers["ETag"] = etag
+    encoding = choose_encoding(request) if len(body) >= MIN_COMPRESS_BYTES else None
+    if encoding == "br":
+        body = brotli.compress(body, quality=5)
+    elif encoding == "gzip":
+        body = gzip.compress(body, compresslevel=6)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, status_code=status_code, media_type=media_type, headers=headers)
@@ -0,0 +1,42 @@
+"""
+Lazy module-level singletons for SkillForge AI
+Shared engines are built on first use rather than at import time, so importing a module stays cheap.
+"""
+
+import threading
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def lazy_singleton(factory: Callable[[], T]) -> Callable[[], T]:
+    """
+    Accessor that calls ``factory`` once, on first use, and returns that instance from then on.
+    ``accessor.peek()`` returns the instance if it was already built, else None, without building it.
+    """
+    lock = threading.Lock()
+    instance = []
+
+    def get() -> T:
+        if not instance:
+            with lock:
+                if not instance:
+                    instance.append(factory())
+        return instance[0]
+
+    def peek() -> Optional[T]:
+        return instance[0] if instance else None
+
+    get.peek = peek
+    get.__doc__ = f"Shared {getattr(factory, '__name__', 'instance')}, constructed on first call"
+    return get
+
+
+def lazy_module_attributes(module_name: str, **accessors: Callable[[], Any]) -> Callable[[str], Any]:
+    """Module ``__getattr__`` resolving each name in ``accessors`` through its lazy accessor"""
+    def __getattr__(name: str) -> Any:
+        if name in accessors:
+            return accessors[name]()
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    return __getattr__
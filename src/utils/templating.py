@@ -0,0 +1,33 @@
+"""
+Template environment for SkillForge AI
+One Jinja2 environment serves the app's pages and server-rendered fragments such as the
+career dashboard. Templates are compiled once and cached; only their data slots are
+filled on each render.
+"""
+
+import hashlib
+from pathlib import Path
+
+import jinja2
+
+TEMPLATE_DIR = Path(__file__).resolve().parents[2] / "frontend" / "templates"
+
+
+def thousands(value: float) -> str:
+    """12345.6 -> '12,346'"""
+    return f"{value:,.0f}"
+
+
+template_env = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(str(TEMPLATE_DIR)),
+    autoescape=jinja2.select_autoescape(["html"]),
+    # Templates ship with the code, so compiled templates never need re-checking on disk
+    auto_reload=False
+)
+template_env.filters["thousands"] = thousands
+
+
+def template_version(name: str) -> str:
+    """Short hash of a template's source, e.g. for ETags of rendered output"""
+    source, _, _ = template_env.loader.get_source(template_env, name)
+    return hashlib.sha256(source.encode()).hexdigest()[:12]
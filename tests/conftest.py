@@ -0,0 +1,25 @@
+"""
+Shared fixtures: a small, fully trained career engine whose model artifacts live in a temporary directory
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.analytics.career_intelligence_engine import CareerIntelligenceEngine
+from src.analytics.model_store import ModelArtifactStore
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: timing checks; deselect with -m 'not benchmark'")
+
+
+@pytest.fixture(scope="session")
+def trained_engine(tmp_path_factory):
+    store = ModelArtifactStore(root=tmp_path_factory.mktemp("models"))
+    engine = CareerIntelligenceEngine(n_samples=800, seed=7, model_store=store)
+    asyncio.run(engine.train_models())
+    return engine
@@ -0,0 +1,87 @@
+"""
+In-memory stand-ins for the few Motor collection and database methods the analytics use
+"""
+import copy
+from collections import defaultdict
+
+
+class FakeCursor:
+    """``to_list(length)`` hands out the next batch of the matched documents"""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.position = 0
+
+    async def to_list(self, length=None):
+        end = len(self.documents) if length is None else self.position + length
+        batch = self.documents[self.position:end]
+        self.position += len(batch)
+        return batch
+
+
+def _matches(document, query):
+    for field, condition in (query or {}).items():
+        value = document.get(field)
+        if isinstance(condition, dict):
+            if '$gte' in condition and not (value is not None and value >= condition['$gte']):
+                return False
+            if '$lte' in condition and not (value is not None and value <= condition['$lte']):
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+def _increment(document, path, amount):
+    *parents, leaf = path.split('.')
+    for parent in parents:
+        document = document.setdefault(parent, {})
+    document[leaf] = document.get(leaf, 0) + amount
+
+
+class FakeCollection:
+    """The handful of Motor collection methods the rollups use, over a list of documents"""
+
+    def __init__(self):
+        self.documents = []
+
+    def find(self, query=None, projection=None, batch_size=None):
+        return FakeCursor([copy.deepcopy(doc) for doc in self.documents if _matches(doc, query)])
+
+    async def find_one(self, query, projection=None):
+        return next((copy.deepcopy(doc) for doc in self.documents if _matches(doc, query)), None)
+
+    async def count_documents(self, query):
+        return sum(1 for doc in self.documents if _matches(doc, query))
+
+    async def insert_many(self, documents):
+        self.documents.extend(copy.deepcopy(documents))
+
+    async def delete_many(self, query):
+        self.documents = [doc for doc in self.documents if not _matches(doc, query)]
+
+    async def update_one(self, query, update, upsert=False):
+        document = next((doc for doc in self.documents if _matches(doc, query)), None)
+        if document is None:
+            if not upsert:
+                return
+            document = {**query, **update.get('$setOnInsert', {})}
+            self.documents.append(document)
+        for field, amount in update.get('$inc', {}).items():
+            _increment(document, field, amount)
+        document.update(update.get('$set', {}))
+
+    async def bulk_write(self, requests, ordered=True):
+        for request in requests:
+            await self.update_one(request._filter, request._doc, upsert=request._upsert)
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.collections = defaultdict(FakeCollection)
+
+    def __getitem__(self, name):
+        return self.collections[name]
+
+    def __getattr__(self, name):
+        return self.collections[name]
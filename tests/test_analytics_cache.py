@@ -0,0 +1,118 @@
+"""
+SingleFlightCache: concurrent misses share one computation, failures are not cached, and a data
+version bump makes every cached analytics result stale
+"""
+import asyncio
+
+import pytest
+
+from fake_mongo import FakeDatabase
+from src.analytics import data_science_engine
+from src.analytics.analytics_cache import SingleFlightCache, bump_data_version, data_version
+from src.analytics.metrics_cache import TTLCache
+
+
+class CountingFactory:
+    """Async computation that counts its runs and holds each until ``release`` is set"""
+
+    def __init__(self, fail_first: bool = False):
+        self.calls = 0
+        self.fail_first = fail_first
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.fail_first and self.calls == 1:
+            raise RuntimeError("aggregation failed")
+        return {"run": self.calls}
+
+
+def _cache() -> SingleFlightCache:
+    return SingleFlightCache(TTLCache(max_size=16, ttl_seconds=60))
+
+
+def test_concurrent_misses_share_one_computation():
+    async def scenario():
+        cache, factory = _cache(), CountingFactory()
+        waiters = [asyncio.create_task(cache.get_or_compute("summary", factory)) for _ in range(10)]
+        await asyncio.sleep(0)
+        factory.release.set()
+        results = await asyncio.gather(*waiters)
+        # Later callers are served from the cache
+        results.append(await cache.get_or_compute("summary", factory))
+        return cache, factory, results
+
+    cache, factory, results = asyncio.run(scenario())
+    assert factory.calls == 1
+    assert all(result is results[0] for result in results)
+    assert cache.stats()["computations"] == 1
+    assert cache.stats()["coalesced"] == 9
+    assert cache.stats()["inflight"] == 0
+
+
+def test_failures_reach_every_waiter_and_are_not_cached():
+    async def scenario():
+        cache, factory = _cache(), CountingFactory(fail_first=True)
+        waiters = [asyncio.create_task(cache.get_or_compute("summary", factory)) for _ in range(5)]
+        await asyncio.sleep(0)
+        factory.release.set()
+        outcomes = await asyncio.gather(*waiters, return_exceptions=True)
+        retried = await cache.get_or_compute("summary", factory)
+        return cache, factory, outcomes, retried
+
+    cache, factory, outcomes, retried = asyncio.run(scenario())
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+    assert retried == {"run": 2}
+    assert factory.calls == 2
+    assert cache.stats()["failures"] == 1
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_computation():
+    async def scenario():
+        cache, factory = _cache(), CountingFactory()
+        dropped = asyncio.create_task(cache.get_or_compute("summary", factory))
+        kept = asyncio.create_task(cache.get_or_compute("summary", factory))
+        await asyncio.sleep(0)
+        dropped.cancel()
+        factory.release.set()
+        return factory, await kept, dropped
+
+    factory, result, dropped = asyncio.run(scenario())
+    assert dropped.cancelled()
+    assert result == {"run": 1}
+    assert factory.calls == 1
+
+
+def test_data_version_bump_forces_a_recompute(monkeypatch):
+    db = FakeDatabase()
+    monkeypatch.setattr(data_science_engine.db_manager, "db", db)
+    engine = data_science_engine.DataScienceEngine()
+    calls = []
+
+    async def compute():
+        calls.append(await data_version(db))
+        return {"version": calls[-1]}
+
+    async def scenario():
+        first = await engine._cached("summary", 30, compute)
+        again = await engine._cached("summary", 30, compute)
+        await bump_data_version(db)
+        after_write = await engine._cached("summary", 30, compute)
+        return first, again, after_write
+
+    first, again, after_write = asyncio.run(scenario())
+    assert first == again == {"version": 0}
+    assert after_write == {"version": 1}
+    assert calls == [0, 1]
+
+
+@pytest.mark.parametrize("bumps", [0, 3])
+def test_data_version_counts_bumps(bumps):
+    async def scenario():
+        db = FakeDatabase()
+        for _ in range(bumps):
+            await bump_data_version(db)
+        return await data_version(db)
+
+    assert asyncio.run(scenario()) == bumps
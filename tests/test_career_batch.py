@@ -0,0 +1,28 @@
+"""
+Batch scoring agrees with the single-profile path
+"""
+import asyncio
+
+PROFILE = {
+    'city': 'San Francisco', 'industry': 'Tech', 'experience_level': 'Senior', 'education': 'Master',
+    'python_skill': 8.0, 'sql_skill': 7.0, 'ml_skill': 6.0, 'communication_skill': 7.0,
+    'portfolio_projects': 5, 'github_commits': 300, 'years_experience': 6.0
+}
+
+
+def test_batch_matches_single_on_non_canonical_input(trained_engine):
+    profiles = [
+        PROFILE,
+        {**PROFILE, 'city': '  san francisco ', 'industry': 'TECH', 'education': 'master'},
+        {**PROFILE, 'city': 'vancouver', 'industry': ' finance', 'python_skill': 6.04},
+    ]
+
+    async def score():
+        batch = await trained_engine.predict_career_metrics_batch(profiles)
+        single = [await trained_engine.predict_career_metrics(profile) for profile in profiles]
+        return batch, single
+
+    batch, single = asyncio.run(score())
+    assert batch == single
+    # Case and padding do not change the encoding
+    assert batch[1] == batch[0]
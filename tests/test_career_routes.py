@@ -0,0 +1,36 @@
+"""
+Career Intelligence routes against the shared, lazily built engine
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routes.career_intelligence_routes import router
+from src.analytics import career_intelligence_engine
+from src.utils.lazy import lazy_singleton
+
+
+@pytest.fixture
+def client(monkeypatch, trained_engine):
+    # A fresh accessor per test, handing out the session's trained engine once something asks for it
+    monkeypatch.setattr(career_intelligence_engine, 'get_career_engine', lazy_singleton(lambda: trained_engine))
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    return TestClient(app)
+
+
+def test_health_before_the_engine_is_built(client):
+    response = client.get("/api/career-intelligence/health")
+    assert response.status_code == 200
+    assert response.json()["engine_loaded"] is False
+
+
+def test_health_after_an_analysis(client):
+    analysis = client.post("/api/career-intelligence/analyze", json={"city": "Toronto", "industry": "Tech"})
+    assert analysis.status_code == 200
+
+    response = client.get("/api/career-intelligence/health")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["engine_loaded"] is True
+    assert body["engine_trained"] is True
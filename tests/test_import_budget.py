@@ -0,0 +1,39 @@
+"""
+Importing the app stays cheap: measured in a fresh interpreter so no module is already cached
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+IMPORT_BUDGET_SECONDS = float(os.getenv("APP_IMPORT_BUDGET_SECONDS", "1.5"))
+
+# Heavy libraries that must only load when a route first needs them
+DEFERRED_MODULES = ("sklearn", "pandas", "numpy", "plotly", "crewai")
+
+_PROBE = (
+    "import sys, time\n"
+    "started = time.perf_counter()\n"
+    "import app\n"
+    "elapsed = time.perf_counter() - started\n"
+    f"print(elapsed, ','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))\n"
+)
+
+
+def _import_app():
+    result = subprocess.run([sys.executable, "-c", _PROBE], cwd=REPO_ROOT, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    elapsed, _, loaded = result.stdout.strip().splitlines()[-1].partition(" ")
+    return float(elapsed), [name for name in loaded.split(",") if name]
+
+
+def test_app_import_within_budget():
+    elapsed, _ = _import_app()
+    assert elapsed < IMPORT_BUDGET_SECONDS, f"import app took {elapsed:.2f}s (budget {IMPORT_BUDGET_SECONDS}s)"
+
+
+def test_app_import_defers_heavy_libraries():
+    _, loaded = _import_app()
+    assert loaded == []
@@ -0,0 +1,39 @@
+"""
+Lazy singletons are built exactly once, on first use, even under concurrent first calls
+"""
+import threading
+import time
+
+import pytest
+
+from src.utils.lazy import lazy_module_attributes, lazy_singleton
+
+
+def test_factory_runs_once_on_first_call():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.01)
+        return object()
+
+    get = lazy_singleton(factory)
+    assert get.peek() is None
+    assert calls == []
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(get())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert get() is results[0]
+    assert get.peek() is results[0]
+
+
+def test_module_attributes_resolve_through_accessors():
+    __getattr__ = lazy_module_attributes("pkg.mod", engine=lambda: "engine")
+    assert __getattr__("engine") == "engine"
+    with pytest.raises(AttributeError, match="pkg.mod"):
+        __getattr__("missing")
@@ -0,0 +1,34 @@
+"""
+ML insights are fitted on every workflow of the window, so repeated calls see the same data
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+from fake_mongo import FakeDatabase
+from src.analytics import data_science_engine
+
+
+def _workflows(now, n):
+    return [{
+        'created_at': now - timedelta(hours=i, minutes=30),
+        'status': ['completed', 'failed', 'in_progress'][i % 3],
+        'priority': ['low', 'medium', 'high'][i % 3],
+        'execution_time': 5.0 + i,
+        'token_usage': {'total_tokens': 100 + i, 'completion_tokens': 40},
+        'user_feedback': {'rating': 1 + i % 5}
+    } for i in range(n)]
+
+
+def test_ml_insights_cover_the_whole_window(monkeypatch):
+    db = FakeDatabase()
+    now = datetime.now()
+    # 7 days of hourly workflows, half of them older than the 3-day window
+    asyncio.run(db.workflows.insert_many(_workflows(now, 24 * 7)))
+    monkeypatch.setattr(data_science_engine.db_manager, "db", db)
+
+    first = asyncio.run(data_science_engine.DataScienceEngine().ml_insights(days_back=3))
+    second = asyncio.run(data_science_engine.DataScienceEngine().ml_insights(days_back=3))
+
+    in_window = asyncio.run(db.workflows.count_documents({'created_at': {'$gte': now - timedelta(days=3)}}))
+    assert first['data_summary']['total_samples'] == in_window
+    assert first['data_summary'] == second['data_summary']
@@ -0,0 +1,24 @@
+"""
+Training fits in-process unless a worker pool is configured or the training set is large
+"""
+from src.analytics import model_training
+from src.analytics.model_training import training_workers
+
+
+def test_small_training_sets_fit_in_process(monkeypatch):
+    monkeypatch.delenv("CAREER_TRAINING_WORKERS", raising=False)
+    assert training_workers() == 1
+    assert training_workers(model_training.PARALLEL_TRAINING_ROWS - 1) == 1
+
+
+def test_large_training_sets_use_a_pool(monkeypatch):
+    monkeypatch.delenv("CAREER_TRAINING_WORKERS", raising=False)
+    monkeypatch.setattr(model_training.os, "cpu_count", lambda: 8)
+    assert training_workers(model_training.PARALLEL_TRAINING_ROWS) == 3
+
+
+def test_configured_workers_win(monkeypatch):
+    monkeypatch.setenv("CAREER_TRAINING_WORKERS", "2")
+    assert training_workers() == 2
+    monkeypatch.setenv("CAREER_TRAINING_WORKERS", "1")
+    assert training_workers(10 * model_training.PARALLEL_TRAINING_ROWS) == 1
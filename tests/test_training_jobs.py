@@ -0,0 +1,43 @@
+"""
+Background training jobs always end in a terminal state, so a later job can start
+"""
+import asyncio
+
+
+def test_cancelled_job_is_marked_and_does_not_block_the_next(monkeypatch, trained_engine):
+    async def scenario():
+        running = asyncio.Event()
+
+        async def never_finishes(job=None):
+            running.set()
+            await asyncio.sleep(3600)
+
+        monkeypatch.setattr(trained_engine, 'train_models', never_finishes)
+        job = trained_engine.start_training_job()
+        await running.wait()
+        assert trained_engine.start_training_job() is job
+
+        trained_engine._active_job_task.cancel()
+        await asyncio.sleep(0)
+        assert job.status == 'cancelled'
+        assert job.finished_at is not None
+
+        assert trained_engine.start_training_job() is not job
+
+    asyncio.run(scenario())
+
+
+def test_job_left_on_a_closed_loop_does_not_block(monkeypatch, trained_engine):
+    async def slow(job=None):
+        await asyncio.sleep(3600)
+
+    monkeypatch.setattr(trained_engine, 'train_models', slow)
+
+    async def start():
+        return trained_engine.start_training_job()
+
+    # asyncio.run cancels the task on exit, before it ever ran
+    first = asyncio.run(start())
+    second = asyncio.run(start())
+    assert second is not first
+    assert first.status in ('queued', 'cancelled')
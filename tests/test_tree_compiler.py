@@ -0,0 +1,58 @@
+"""
+Compiled tree ensembles reproduce sklearn's predictions on held-out rows
+"""
+import numpy as np
+import pytest
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestClassifier, RandomForestRegressor
+
+from src.analytics.tree_compiler import CompiledTreeEnsemble, compile_models
+
+TOLERANCE = 1e-6
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(1500, 11))
+    y_reg = 60000 + 8000 * X[:, 0] - 3000 * X[:, 3] + 500 * rng.normal(size=len(X))
+    y_cls = (X[:, 1] + 0.5 * X[:, 2] + 0.3 * rng.normal(size=len(X)) > 0).astype(int)
+    # Held-out rows the models never saw
+    return X[:1000], X[1000:], y_reg[:1000], y_cls[:1000]
+
+
+@pytest.mark.parametrize("model", [
+    GradientBoostingRegressor(n_estimators=60, max_depth=4, random_state=0),
+    RandomForestRegressor(n_estimators=40, max_depth=8, random_state=0),
+])
+def test_regressors_match_sklearn_predict(data, model):
+    X_train, X_test, y_reg, _ = data
+    model.fit(X_train, y_reg)
+    compiled = CompiledTreeEnsemble.from_sklearn(model)
+    np.testing.assert_allclose(compiled.predict(X_test), model.predict(X_test), rtol=TOLERANCE)
+
+
+def test_classifier_matches_sklearn_predict_and_proba(data):
+    X_train, X_test, _, y_cls = data
+    model = RandomForestClassifier(n_estimators=40, max_depth=8, random_state=0).fit(X_train, y_cls)
+    compiled = CompiledTreeEnsemble.from_sklearn(model)
+    np.testing.assert_allclose(compiled.predict_proba(X_test), model.predict_proba(X_test), atol=TOLERANCE)
+    np.testing.assert_array_equal(compiled.predict(X_test), model.predict(X_test))
+
+
+def test_array_round_trip_preserves_predictions(data):
+    X_train, X_test, y_reg, _ = data
+    model = GradientBoostingRegressor(n_estimators=30, random_state=0).fit(X_train, y_reg)
+    compiled = CompiledTreeEnsemble.from_sklearn(model)
+    rebuilt = CompiledTreeEnsemble.from_arrays(*compiled.to_arrays())
+    np.testing.assert_array_equal(rebuilt.predict(X_test), compiled.predict(X_test))
+
+
+def test_compile_models_skips_unsupported_estimators(data):
+    from sklearn.linear_model import LinearRegression
+
+    X_train, X_test, y_reg, _ = data
+    models = {
+        'boosted': GradientBoostingRegressor(n_estimators=20, random_state=0).fit(X_train, y_reg),
+        'linear': LinearRegression().fit(X_train, y_reg)
+    }
+    assert set(compile_models(models, X_test)) == {'boosted'}
@@ -0,0 +1,63 @@
+"""
+read_workflow_frame drains a cursor in batches and survives malformed documents
+"""
+import asyncio
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from fake_mongo import FakeCursor
+from src.analytics.workflow_reader import read_workflow_frame
+
+
+def _read(documents, **kwargs):
+    return asyncio.run(read_workflow_frame(FakeCursor(documents), **kwargs))
+
+
+def _workflow(i, **overrides):
+    doc = {
+        'created_at': datetime(2024, 1, 1 + i % 28),
+        'status': 'completed',
+        'priority': 'high',
+        'industry': 'finance',
+        'execution_time': 10.0 + i,
+        'token_usage': {'total_tokens': 100 + i, 'completion_tokens': 50},
+        'user_feedback': {'rating': 4}
+    }
+    doc.update(overrides)
+    return doc
+
+
+def test_batches_and_growth_match_the_documents():
+    documents = [_workflow(i) for i in range(23)]
+    frame = _read(documents, expected=4, batch_size=5)
+    assert len(frame) == 23
+    assert frame['execution_time'].tolist() == [10.0 + i for i in range(23)]
+    assert frame['total_tokens'].tolist() == [100.0 + i for i in range(23)]
+    assert frame['created_at'].iloc[3] == pd.Timestamp(2024, 1, 4)
+
+
+def test_malformed_values_fall_back_to_the_fill_value():
+    documents = [
+        _workflow(0),
+        _workflow(1, execution_time='30s'),
+        _workflow(2, execution_time='12.5', token_usage={'total_tokens': 'many', 'completion_tokens': [1, 2]}),
+        _workflow(3, created_at='not a date', user_feedback={'rating': {'stars': 5}}),
+        _workflow(4, token_usage='n/a', user_feedback=None)
+    ]
+    frame = _read(documents, batch_size=10)
+    assert len(frame) == 5
+    assert frame['execution_time'].iloc[0] == 10.0
+    assert np.isnan(frame['execution_time'].iloc[1])
+    assert frame['execution_time'].iloc[2] == 12.5
+    assert frame['total_tokens'].tolist() == [100.0, 101.0, 0.0, 103.0, 0.0]
+    assert frame['completion_tokens'].tolist() == [50.0, 50.0, 0.0, 50.0, 0.0]
+    assert pd.isna(frame['created_at'].iloc[3])
+    assert frame['feedback_rating'].tolist() == [4.0, 4.0, 4.0, 0.0, 0.0]
+
+
+def test_columns_follow_the_documents():
+    assert _read([]).empty
+    frame = _read([{'status': 'failed', 'execution_time': 3}])
+    assert list(frame.columns) == ['status', 'execution_time']
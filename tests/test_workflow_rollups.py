@@ -0,0 +1,133 @@
+"""
+Workflow rollups: live writes and the backfill build the same documents, and summaries read from
+them agree with the same statistics computed by pandas over the raw workflows
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fake_mongo import FakeDatabase
+from src.analytics.workflow_queries import (
+    DEFAULT_STATUS_SCORE, EXECUTION_TIME_PENALTY, FEEDBACK_WEIGHT, STATUS_SCORES, SUCCESS_THRESHOLD
+)
+from src.analytics.workflow_rollups import (
+    DAILY_COLLECTION, HOURLY_COLLECTION, _p95, backfill_rollups, fetch_rollup_summary, record_workflow
+)
+
+
+START = datetime(2024, 3, 4)
+END = START + timedelta(days=3) - timedelta(microseconds=1)
+
+
+def _workflows(n=600, seed=3):
+    rng = np.random.default_rng(seed)
+    workflows = []
+    for i in range(n):
+        workflow = {
+            'created_at': START + timedelta(minutes=int(rng.integers(0, 3 * 24 * 60))),
+            'status': str(rng.choice(['completed', 'in_progress', 'failed', 'cancelled'], p=[0.6, 0.2, 0.1, 0.1])),
+            'priority': str(rng.choice(['low', 'medium', 'high', 'urgent'])),
+            'industry': str(rng.choice(['technology', 'finance', 'healthcare'])),
+            'execution_time': float(rng.lognormal(3, 0.8)) if i % 7 else None,
+            'token_usage': {'total_tokens': int(rng.integers(100, 5000))}
+        }
+        if i % 3:
+            workflow['user_feedback'] = {'rating': int(rng.integers(1, 6))}
+        workflows.append(workflow)
+    return workflows
+
+
+def _expected(workflows):
+    """The dashboard statistics, straight from the raw workflows"""
+    df = pd.DataFrame(workflows)
+    execution_time = pd.to_numeric(df['execution_time'])
+    p95 = float(np.percentile(execution_time.dropna(), 95))
+    rating = df['user_feedback'].apply(lambda x: x.get('rating', 0) if isinstance(x, dict) else 0)
+    penalty = (execution_time / p95 * EXECUTION_TIME_PENALTY).clip(0, EXECUTION_TIME_PENALTY).fillna(0)
+    score = (df['status'].map(STATUS_SCORES).fillna(DEFAULT_STATUS_SCORE) - penalty + rating * FEEDBACK_WEIGHT).clip(0, 100)
+    df['success_score'] = score
+    return df, p95
+
+
+def _rollup_documents(db):
+    return {name: sorted(db[name].documents, key=lambda doc: doc['_id']) for name in (HOURLY_COLLECTION, DAILY_COLLECTION)}
+
+
+@pytest.fixture(scope="module")
+def rollups():
+    workflows = _workflows()
+
+    async def build():
+        live, backfilled = FakeDatabase(), FakeDatabase()
+        for workflow in workflows:
+            await record_workflow(live, workflow)
+        await backfilled.workflows.insert_many(workflows)
+        counts = await backfill_rollups(backfilled, batch_size=128)
+        summary = await fetch_rollup_summary(live, START, END)
+        return live, backfilled, counts, summary
+
+    return (workflows, *asyncio.run(build()))
+
+
+def test_live_writes_and_backfill_build_the_same_rollups(rollups):
+    workflows, live, backfilled, counts, _ = rollups
+    assert counts['workflows'] == len(workflows)
+    assert counts[DAILY_COLLECTION] == 3
+    assert _rollup_documents(live) == _rollup_documents(backfilled)
+
+
+def test_counts_match_pandas(rollups):
+    workflows, _, _, _, summary = rollups
+    df, _ = _expected(workflows)
+    created_at = df['created_at']
+
+    assert summary['total'] == len(df)
+    assert summary['completed'] == int((df['status'] == 'completed').sum())
+    assert summary['avg_execution_time'] == pytest.approx(pd.to_numeric(df['execution_time']).mean())
+    assert summary['avg_tokens'] == pytest.approx(df['token_usage'].str.get('total_tokens').mean())
+    assert summary['daily_counts'] == [
+        {'date': day, 'count': int(count)} for day, count in created_at.dt.date.value_counts().sort_index().items()
+    ]
+    assert summary['hourly_counts'] == [
+        {'hour': hour, 'count': int(count)} for hour, count in created_at.dt.hour.value_counts().sort_index().items()
+    ]
+    assert summary['peak_hour'] == created_at.dt.hour.mode().iloc[0]
+    assert summary['busiest_day'] == created_at.dt.dayofweek.mode().iloc[0]
+    assert {row['_id']: row['count'] for row in summary['priority']} == df['priority'].value_counts().to_dict()
+    assert {row['_id']: row['count'] for row in summary['industry']} == df['industry'].value_counts().to_dict()
+
+
+def test_success_scores_match_pandas_within_bucket_resolution(rollups):
+    workflows, _, _, _, summary = rollups
+    df, p95 = _expected(workflows)
+
+    assert summary['p95_execution_time'] == pytest.approx(p95, rel=0.05)
+    assert summary['avg_success_score'] == pytest.approx(df['success_score'].mean(), abs=0.5)
+    assert abs(summary['successful'] - int((df['success_score'] > SUCCESS_THRESHOLD).sum())) <= 0.03 * len(df)
+    by_industry = df.groupby('industry')['success_score']
+    for row in summary['industry']:
+        assert row['mean'] == pytest.approx(by_industry.mean()[row['_id']], abs=0.75)
+        assert row['std'] == pytest.approx(by_industry.std()[row['_id']], abs=0.75)
+    by_priority = df.groupby('priority')['success_score'].mean()
+    for row in summary['priority']:
+        assert row['avg_success_score'] == pytest.approx(by_priority[row['_id']], abs=0.75)
+
+
+def test_p95_of_the_bucket_histogram():
+    assert _p95({}) is None
+    assert _p95({'completed|0|none': 5}) is None
+    assert _p95({'completed|0|zero': 20}) == 0.0
+    # Bucket 16 covers 16..~19 s (quarter octaves above 2**4)
+    assert 16 <= _p95({'completed|0|16': 100}) < 2 ** (17 / 4)
+    assert 2 ** (20 / 4) <= _p95({'completed|0|zero': 50, 'completed|50|12': 40, 'failed|0|20': 10, 'completed|0|none': 99}) < 2 ** (21 / 4)
+
+
+def test_empty_window():
+    summary = asyncio.run(fetch_rollup_summary(FakeDatabase(), START, END))
+    assert summary['total'] == 0
+    assert summary['avg_success_score'] is None
+    assert summary['p95_execution_time'] is None
+    assert summary['daily_counts'] == []